@@ -6,6 +6,14 @@ Extract decisions, track progress, generate reports from Claude Code sessions.
 
 __version__ = "0.1.0"
 
-from claude_code_tracker.core.extractor import ClaudeConversationExtractor
-
 __all__ = ["ClaudeConversationExtractor", "__version__"]
+
+
+def __getattr__(name):
+    # PEP 562: import the extractor lazily so `import claude_code_tracker`
+    # stays cheap for callers that never touch it (e.g. `cct --help`).
+    if name == "ClaudeConversationExtractor":
+        from claude_code_tracker.core.extractor import ClaudeConversationExtractor
+
+        return ClaudeConversationExtractor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,39 +5,266 @@ Command-line interface for Claude Code Tracker.
 
 import argparse
 import sys
-from datetime import datetime
-from pathlib import Path
 
-try:
-    from claude_code_tracker.core.extractor import ClaudeConversationExtractor
-except ImportError:
-    from extract_claude_logs import ClaudeConversationExtractor
+_extractor_cls = None
+
+# Pregenerated from _build_parser().format_help() so `cct --help` never has to
+# construct the parser. Regenerate when arguments change:
+#   python -c "from claude_code_tracker.cli import _build_parser; \
+#       print(_build_parser().format_help())"
+_HELP_TEXT = """\
+usage: cct [-h] [--list] [--extract EXTRACT] [--all] [--recent RECENT]
+           [--output OUTPUT] [--limit LIMIT] [--interactive] [--export EXPORT]
+           [--search SEARCH] [--search-regex SEARCH_REGEX]
+           [--search-date-from SEARCH_DATE_FROM]
+           [--search-date-to SEARCH_DATE_TO]
+           [--search-speaker {human,assistant,both}] [--case-sensitive]
+           [--format {markdown,json,html}] [--detailed]
+
+Claude Code Tracker - Extract and manage Claude Code conversations
+
+options:
+  -h, --help            show this help message and exit
+  --list                List recent sessions
+  --extract EXTRACT     Extract specific session(s) by number (comma-
+                        separated)
+  --all, --logs         Extract all sessions
+  --recent RECENT       Extract N most recent sessions
+  --output OUTPUT       Output directory for markdown files
+  --limit LIMIT         Limit for --list command (default: show all)
+  --interactive, -i, --start, -s
+                        Launch interactive UI for easy extraction
+  --export EXPORT       Export mode: 'logs' for interactive UI
+  --search SEARCH       Search conversations for text (smart search)
+  --search-regex SEARCH_REGEX
+                        Search conversations using regex pattern
+  --search-date-from SEARCH_DATE_FROM
+                        Filter search from date (YYYY-MM-DD)
+  --search-date-to SEARCH_DATE_TO
+                        Filter search to date (YYYY-MM-DD)
+  --search-speaker {human,assistant,both}
+                        Filter search by speaker
+  --case-sensitive      Make search case-sensitive
+  --format {markdown,json,html}
+                        Output format for exported conversations (default:
+                        markdown)
+  --detailed            Include tool use, MCP responses, and system messages
+                        in export
 
+Examples:
+  cct --list                    # List all available sessions
+  cct --extract 1               # Extract the most recent session
+  cct --extract 1,3,5           # Extract specific sessions
+  cct --recent 5                # Extract 5 most recent sessions
+  cct --all                     # Extract all sessions
+  cct --output ~/my-logs        # Specify output directory
+  cct --search "python error"   # Search conversations
+  cct --search-regex "import.*" # Search with regex
+  cct --format json --all       # Export all as JSON
+  cct --format html --extract 1 # Export session 1 as HTML
+  cct --detailed --extract 1    # Include tool use & system messages
+"""
 
-def main():
-    """Main CLI entry point."""
-    parser = argparse.ArgumentParser(
+
+def _parse_index_list(s):
+    """argparse type= callable: parse '1,3,5' into 0-based indices at parse time."""
+    indices = []
+    for tok in s.split(","):
+        tok = tok.strip()
+        if not tok:
+            continue
+        if not tok.lstrip("-").isdigit():
+            raise argparse.ArgumentTypeError(f"invalid session number: {tok}")
+        indices.append(int(tok) - 1)
+    return indices
+
+
+def _get_extractor_cls():
+    """Import and cache the extractor class on first use.
+
+    Importing lazily keeps `cct --help` / argument-error paths from paying
+    for the extractor module (and everything it pulls in).
+    """
+    global _extractor_cls
+    if _extractor_cls is None:
+        try:
+            from claude_code_tracker.core.extractor import ClaudeConversationExtractor
+        except ImportError:
+            from extract_claude_logs import ClaudeConversationExtractor
+        _extractor_cls = ClaudeConversationExtractor
+    return _extractor_cls
+
+
+class CliArgs:
+    """Slotted container for parsed arguments.
+
+    Slot access is faster than argparse.Namespace's instance dict, and the
+    fixed field list catches typo'd attribute names early.
+    """
+
+    __slots__ = (
+        "list",
+        "extract",
+        "all",
+        "recent",
+        "output",
+        "limit",
+        "interactive",
+        "export",
+        "search",
+        "search_regex",
+        "search_date_from",
+        "search_date_to",
+        "search_speaker",
+        "case_sensitive",
+        "format",
+        "detailed",
+    )
+
+    def __init__(self, **kwargs):
+        for name, value in kwargs.items():
+            setattr(self, name, value)
+
+
+def _fast_parse(argv):
+    """Hand-rolled getopt parse for the common flag set.
+
+    Returns a namespace matching argparse's output, or None to fall back to
+    the full argparse parser (for --help, unknown flags, or invalid values)
+    so error messages stay polished.
+    """
+    import getopt
+
+    try:
+        opts, extra = getopt.gnu_getopt(
+            argv,
+            "is",
+            [
+                "list",
+                "extract=",
+                "all",
+                "logs",
+                "recent=",
+                "output=",
+                "limit=",
+                "interactive",
+                "start",
+                "export=",
+                "search=",
+                "search-regex=",
+                "search-date-from=",
+                "search-date-to=",
+                "search-speaker=",
+                "case-sensitive",
+                "format=",
+                "detailed",
+                "help",
+            ],
+        )
+    except getopt.GetoptError:
+        return None
+    if extra:
+        return None
+
+    args = CliArgs(
+        list=False,
+        extract=None,
+        all=False,
+        recent=0,
+        output=None,
+        limit=None,
+        interactive=False,
+        export=None,
+        search=None,
+        search_regex=None,
+        search_date_from=None,
+        search_date_to=None,
+        search_speaker="both",
+        case_sensitive=False,
+        format="markdown",
+        detailed=False,
+    )
+
+    try:
+        for opt, val in opts:
+            if opt == "--help":
+                return None
+            elif opt == "--list":
+                args.list = True
+            elif opt == "--extract":
+                args.extract = _parse_index_list(val)
+            elif opt in ("--all", "--logs"):
+                args.all = True
+            elif opt == "--recent":
+                args.recent = int(val)
+            elif opt == "--output":
+                args.output = val
+            elif opt == "--limit":
+                args.limit = int(val)
+            elif opt in ("-i", "-s", "--interactive", "--start"):
+                args.interactive = True
+            elif opt == "--export":
+                args.export = val
+            elif opt == "--search":
+                args.search = val
+            elif opt == "--search-regex":
+                args.search_regex = val
+            elif opt == "--search-date-from":
+                args.search_date_from = val
+            elif opt == "--search-date-to":
+                args.search_date_to = val
+            elif opt == "--search-speaker":
+                if val not in ("human", "assistant", "both"):
+                    return None
+                args.search_speaker = sys.intern(val)
+            elif opt == "--case-sensitive":
+                args.case_sensitive = True
+            elif opt == "--format":
+                if val not in ("markdown", "json", "html"):
+                    return None
+                args.format = sys.intern(val)
+            elif opt == "--detailed":
+                args.detailed = True
+    except (ValueError, argparse.ArgumentTypeError):
+        return None
+
+    return args
+
+
+class _LazyEpilogParser(argparse.ArgumentParser):
+    """ArgumentParser that loads its examples epilog only when help is shown."""
+
+    def format_help(self):
+        if self.epilog is None:
+            try:
+                from importlib.resources import files
+
+                self.epilog = (
+                    files("claude_code_tracker")
+                    .joinpath("_help_epilog.txt")
+                    .read_text(encoding="utf-8")
+                )
+            except Exception:
+                self.epilog = ""
+        return super().format_help()
+
+
+_PARSER = None
+
+
+def _build_parser():
+    """Construct the full argument parser once and reuse it (slow path only)."""
+    global _PARSER
+    if _PARSER is not None:
+        return _PARSER
+    parser = _LazyEpilogParser(
         description="Claude Code Tracker - Extract and manage Claude Code conversations",
         formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  %(prog)s --list                    # List all available sessions
-  %(prog)s --extract 1               # Extract the most recent session
-  %(prog)s --extract 1,3,5           # Extract specific sessions
-  %(prog)s --recent 5                # Extract 5 most recent sessions
-  %(prog)s --all                     # Extract all sessions
-  %(prog)s --output ~/my-logs        # Specify output directory
-  %(prog)s --search "python error"   # Search conversations
-  %(prog)s --search-regex "import.*" # Search with regex
-  %(prog)s --format json --all       # Export all as JSON
-  %(prog)s --format html --extract 1 # Export session 1 as HTML
-  %(prog)s --detailed --extract 1    # Include tool use & system messages
-        """,
     )
     parser.add_argument("--list", action="store_true", help="List recent sessions")
     parser.add_argument(
         "--extract",
-        type=str,
+        type=_parse_index_list,
         help="Extract specific session(s) by number (comma-separated)",
     )
     parser.add_argument(
@@ -84,6 +311,7 @@ Examples:
     )
     parser.add_argument(
         "--search-speaker",
+        type=sys.intern,
         choices=["human", "assistant", "both"],
         default="both",
         help="Filter search by speaker",
@@ -93,8 +321,11 @@ Examples:
     )
 
     # Export format arguments
+    # Interned so downstream comparisons against the literal choices hit the
+    # pointer-equality fast path instead of full string compares
     parser.add_argument(
         "--format",
+        type=sys.intern,
         choices=["markdown", "json", "html"],
         default="markdown",
         help="Output format for exported conversations (default: markdown)",
@@ -105,21 +336,44 @@ Examples:
         help="Include tool use, MCP responses, and system messages in export",
     )
 
-    args = parser.parse_args()
+    _PARSER = parser
+    return parser
+
+
+def main():
+    """Main CLI entry point."""
+    # Fast path: the common invocations (`cct`, `cct -i`, `cct --list`) don't
+    # need the full parser, so dispatch on sys.argv before building it.
+    argv = sys.argv[1:]
+    if argv in (["-h"], ["--help"]):
+        sys.stdout.write(_HELP_TEXT)
+        return
+    if not argv or argv in (["-i"], ["--interactive"], ["-s"], ["--start"]):
+        _launch_interactive_ui()
+        return
+    if argv == ["--list"]:
+        extractor = _get_extractor_cls()(None)
+        extractor.list_recent_sessions(None)
+        return
+
+    args = _fast_parse(argv)
+    if args is None:
+        # Unknown/invalid input: let argparse produce the polished error
+        args = CliArgs(**vars(_build_parser().parse_args()))
 
     # Handle interactive mode
     if args.interactive or (args.export and args.export.lower() == "logs"):
-        launch_interactive()
+        _launch_interactive_ui()
         return
 
-    # Initialize extractor with optional output directory
-    extractor = ClaudeConversationExtractor(args.output)
-
-    # Handle search mode
+    # Handle search mode (no extractor needed unless the user views a hit)
     if args.search or args.search_regex:
-        _handle_search(args, extractor)
+        _handle_search(args)
         return
 
+    # Initialize extractor with optional output directory
+    extractor = _get_extractor_cls()(args.output)
+
     # Default action is to list sessions
     if args.list or (
         not args.extract
@@ -137,55 +391,38 @@ Examples:
             print("  cct --all                   # Extract all sessions")
 
     elif args.extract:
+        # Indices were already parsed and validated by argparse
         sessions = extractor.find_sessions()
-
-        # Parse comma-separated indices
-        indices = []
-        for num in args.extract.split(","):
-            try:
-                idx = int(num.strip()) - 1  # Convert to 0-based index
-                indices.append(idx)
-            except ValueError:
-                print(f"❌ Invalid session number: {num}")
-                continue
-
-        if indices:
-            print(f"\n📤 Extracting {len(indices)} session(s) as {args.format.upper()}...")
-            if args.detailed:
-                print("📋 Including detailed tool use and system messages")
-            success, total = extractor.extract_multiple(
-                sessions, indices, format=args.format, detailed=args.detailed
-            )
-            print(f"\n✅ Successfully extracted {success}/{total} sessions")
+        _run_extract(extractor, sessions, args.extract, args)
 
     elif args.recent:
         sessions = extractor.find_sessions()
-        limit = min(args.recent, len(sessions))
-        print(f"\n📤 Extracting {limit} most recent sessions as {args.format.upper()}...")
-        if args.detailed:
-            print("📋 Including detailed tool use and system messages")
-
-        indices = list(range(limit))
-        success, total = extractor.extract_multiple(
-            sessions, indices, format=args.format, detailed=args.detailed
-        )
-        print(f"\n✅ Successfully extracted {success}/{total} sessions")
+        indices = list(range(min(args.recent, len(sessions))))
+        _run_extract(extractor, sessions, indices, args)
 
     elif args.all:
         sessions = extractor.find_sessions()
-        print(f"\n📤 Extracting all {len(sessions)} sessions as {args.format.upper()}...")
-        if args.detailed:
-            print("📋 Including detailed tool use and system messages")
-
         indices = list(range(len(sessions)))
-        success, total = extractor.extract_multiple(
-            sessions, indices, format=args.format, detailed=args.detailed
-        )
-        print(f"\n✅ Successfully extracted {success}/{total} sessions")
+        _run_extract(extractor, sessions, indices, args, label="all ")
 
 
-def _handle_search(args, extractor):
+def _run_extract(extractor, sessions, indices, args, label=""):
+    """Extract the selected sessions and report progress."""
+    fmt = args.format.upper()
+    print(f"\n📤 Extracting {label}{len(indices)} session(s) as {fmt}...")
+    if args.detailed:
+        print("📋 Including detailed tool use and system messages")
+    success, total = extractor.extract_multiple(
+        sessions, indices, format=args.format, detailed=args.detailed, parallel=len(indices) > 1
+    )
+    print(f"\n✅ Successfully extracted {success}/{total} sessions")
+
+
+def _handle_search(args):
     """Handle search mode."""
+    from collections import defaultdict
+    from datetime import datetime
+
     try:
         from claude_code_tracker.search.searcher import ConversationSearcher
     except ImportError:
@@ -204,16 +441,17 @@ def _handle_search(args, extractor):
     # Parse date filters
     date_from = None
     date_to = None
+    # fromisoformat is a C fast path for YYYY-MM-DD, unlike strptime
     if args.search_date_from:
         try:
-            date_from = datetime.strptime(args.search_date_from, "%Y-%m-%d")
+            date_from = datetime.fromisoformat(args.search_date_from)
         except ValueError:
             print(f"❌ Invalid date format: {args.search_date_from}")
             return
 
     if args.search_date_to:
         try:
-            date_to = datetime.strptime(args.search_date_to, "%Y-%m-%d")
+            date_to = datetime.fromisoformat(args.search_date_to)
         except ValueError:
             print(f"❌ Invalid date format: {args.search_date_to}")
             return
@@ -221,54 +459,72 @@ def _handle_search(args, extractor):
     # Speaker filter
     speaker_filter = None if args.search_speaker == "both" else args.search_speaker
 
-    # Perform search
+    # Perform search, streaming results so matches display as they are found
+    # and the search stops as soon as enough hits are produced
     print(f"🔍 Searching for: {query}")
-    results = searcher.search(
+    max_results = 30
+    total = 0
+    results_by_file = defaultdict(list)
+    # Parent names are cached so each display only builds the Path.parent
+    # object once per file
+    parent_names = {}
+    for result in searcher.search_iter(
         query=query,
         mode=mode,
         date_from=date_from,
         date_to=date_to,
         speaker_filter=speaker_filter,
         case_sensitive=args.case_sensitive,
-        max_results=30,
-    )
+    ):
+        file_results = results_by_file[result.file_path]
+        if not file_results:
+            parent_names[result.file_path] = result.file_path.parent.name
+            # First hit in this file: show its header and a preview in a
+            # single buffered write rather than one print per line
+            sys.stdout.write(
+                f"\n{len(results_by_file)}. 📄 {parent_names[result.file_path]}\n"
+                f"   {result.speaker}: {result.preview}...\n"
+            )
+        file_results.append(result)
+        total += 1
+        if total >= max_results:
+            break
 
-    if not results:
+    if not total:
         print("❌ No matches found.")
         return
 
-    print(f"\n✅ Found {len(results)} matches across conversations:")
-
-    # Group and display results
-    results_by_file = {}
-    for result in results:
-        if result.file_path not in results_by_file:
-            results_by_file[result.file_path] = []
-        results_by_file[result.file_path].append(result)
+    print(f"\n✅ Found {total} matches across {len(results_by_file)} conversations")
 
     # Store file paths for potential viewing
-    file_paths_list = []
-    for file_path, file_results in results_by_file.items():
-        file_paths_list.append(file_path)
-        print(
-            f"\n{len(file_paths_list)}. 📄 {file_path.parent.name} ({len(file_results)} matches)"
-        )
-        # Show first match preview
-        first = file_results[0]
-        print(f"   {first.speaker}: {first.matched_content[:100]}...")
+    file_paths_list = list(results_by_file.keys())
 
-    # Offer to view conversations
+    # Offer to view conversations; skip prompts entirely (and the readline
+    # import input() drags in) when stdin isn't a TTY, e.g. piped usage
+    if not sys.stdin.isatty():
+        return
     if file_paths_list:
         print("\n" + "=" * 60)
         try:
-            view_choice = input(
-                f"\nView a conversation? Enter number (1-{len(file_paths_list)}) or press Enter to skip: "
-            ).strip()
+            if len(file_paths_list) == 1:
+                # Single matching conversation: a y/N prompt beats asking
+                # for a number between 1 and 1
+                view_choice = (
+                    input("\nView this conversation? (y/N): ").strip().lower()
+                )
+                view_choice = "1" if view_choice == "y" else ""
+            else:
+                view_choice = input(
+                    f"\nView a conversation? Enter number (1-{len(file_paths_list)}) "
+                    "or press Enter to skip: "
+                ).strip()
 
             if view_choice.isdigit():
                 view_num = int(view_choice)
                 if 1 <= view_num <= len(file_paths_list):
                     selected_path = file_paths_list[view_num - 1]
+                    # Only build the extractor once the user actually views a hit
+                    extractor = _get_extractor_cls()(args.output)
                     extractor.display_conversation(selected_path, detailed=args.detailed)
 
                     # Offer to extract after viewing
@@ -289,15 +545,20 @@ def _handle_search(args, extractor):
             print("\n👋 Cancelled")
 
 
+def _launch_interactive_ui():
+    """Import and run the interactive UI."""
+    try:
+        from claude_code_tracker.ui.interactive import main as interactive_main
+    except ImportError:
+        from interactive_ui import main as interactive_main
+    interactive_main()
+
+
 def launch_interactive():
     """Launch the interactive UI directly, or handle search if specified."""
     # If no arguments provided (or just the command itself), launch interactive UI
     if len(sys.argv) <= 1:
-        try:
-            from claude_code_tracker.ui.interactive import main as interactive_main
-        except ImportError:
-            from interactive_ui import main as interactive_main
-        interactive_main()
+        _launch_interactive_ui()
     # Check if 'search' was passed as an argument
     elif len(sys.argv) > 1 and sys.argv[1] == "search":
         try:
@@ -311,7 +572,7 @@ def launch_interactive():
             from search_conversations import ConversationSearcher
 
         # Initialize components
-        extractor = ClaudeConversationExtractor()
+        extractor = _get_extractor_cls()()
         searcher = ConversationSearcher()
         smart_searcher = create_smart_searcher(searcher)
 
@@ -323,6 +584,9 @@ def launch_interactive():
             # View the selected conversation
             extractor.display_conversation(selected_file)
 
+            if not sys.stdin.isatty():
+                return
+
             # Offer to extract
             try:
                 extract_choice = (
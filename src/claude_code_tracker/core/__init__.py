@@ -1,5 +1,12 @@
 """Core functionality for extracting and exporting Claude Code conversations."""
 
-from claude_code_tracker.core.extractor import ClaudeConversationExtractor
-
 __all__ = ["ClaudeConversationExtractor"]
+
+
+def __getattr__(name):
+    # PEP 562 lazy import: keep `import claude_code_tracker.core` cheap.
+    if name == "ClaudeConversationExtractor":
+        from claude_code_tracker.core.extractor import ClaudeConversationExtractor
+
+        return ClaudeConversationExtractor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
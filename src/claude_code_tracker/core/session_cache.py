@@ -0,0 +1,81 @@
+"""
+On-disk cache for discovered session files.
+
+Repeated CLI invocations (`cct --list` followed by `cct --extract 1`) rescan
+~/.claude/projects/ from scratch. This module persists the discovered session
+list together with a cheap directory stamp so unchanged session stores skip
+the recursive walk entirely.
+"""
+
+import os
+import pickle
+from pathlib import Path
+from typing import List, Optional
+
+CACHE_DIR = Path.home() / ".cache" / "claude_code_tracker"
+CACHE_FILE = CACHE_DIR / "sessions.pkl"
+
+_CACHE_VERSION = 1
+
+
+def _directory_stamp(search_dir: Path) -> Optional[tuple]:
+    """Build a cheap fingerprint of the session store.
+
+    Sessions live one level deep (projects/<project>/<session>.jsonl), and a
+    project directory's mtime changes whenever session files are added or
+    removed, so a single-level scandir is enough to detect staleness.
+    """
+    try:
+        with os.scandir(search_dir) as entries:
+            return tuple(sorted((e.name, e.stat().st_mtime_ns) for e in entries))
+    except OSError:
+        return None
+
+
+def load_cached_sessions(search_dir: Path) -> Optional[List[Path]]:
+    """Return the cached session list if the store is unchanged, else None."""
+    try:
+        with open(CACHE_FILE, "rb") as f:
+            cached = pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError):
+        return None
+
+    if not isinstance(cached, dict) or cached.get("version") != _CACHE_VERSION:
+        return None
+
+    entry = cached.get(str(search_dir))
+    if not entry:
+        return None
+
+    stamp = _directory_stamp(search_dir)
+    if stamp is None or stamp != entry.get("stamp"):
+        return None
+
+    return [Path(p) for p in entry["sessions"]]
+
+
+def store_sessions(search_dir: Path, sessions: List[Path]) -> None:
+    """Persist the session list for search_dir; failures are non-fatal."""
+    stamp = _directory_stamp(search_dir)
+    if stamp is None:
+        return
+
+    try:
+        with open(CACHE_FILE, "rb") as f:
+            cached = pickle.load(f)
+        if not isinstance(cached, dict) or cached.get("version") != _CACHE_VERSION:
+            cached = {"version": _CACHE_VERSION}
+    except (OSError, pickle.PickleError, EOFError):
+        cached = {"version": _CACHE_VERSION}
+
+    cached[str(search_dir)] = {
+        "stamp": stamp,
+        "sessions": [str(p) for p in sessions],
+    }
+
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(CACHE_FILE, "wb") as f:
+            pickle.dump(cached, f)
+    except OSError:
+        pass
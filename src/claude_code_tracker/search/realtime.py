@@ -8,6 +8,7 @@ import os
 import sys
 import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -251,6 +252,7 @@ class RealTimeSearch:
         self.results_cache = {}
         self.debounce_delay = 0.3  # 300ms debounce
         self.stop_event = threading.Event()  # For clean thread shutdown
+        self._epoch = 0  # Bumped per keystroke; stale searches are discarded
 
     def _process_search_request(self):
         """Process a single search request (extracted for testing)"""
@@ -263,6 +265,7 @@ class RealTimeSearch:
                 return False
 
             query = self.state.query
+            epoch = self._epoch
             self.state.is_searching = False
 
         if not query:
@@ -294,6 +297,10 @@ class RealTimeSearch:
             self.results_cache[query] = results
 
             with self.search_lock:
+                # A newer keystroke superseded this search while it ran;
+                # drop its results instead of flashing them on screen
+                if epoch != self._epoch:
+                    return True
                 self.state.results = results
                 self.state.selected_index = 0
         except Exception:
@@ -374,6 +381,7 @@ class RealTimeSearch:
     def trigger_search(self):
         """Trigger a new search with debouncing"""
         with self.search_lock:
+            self._epoch += 1
             self.state.last_update = time.time()
             self.state.is_searching = True
             # Clear cache for partial matches
@@ -453,20 +461,53 @@ def create_smart_searcher(searcher):
     """Enhance the searcher with smart search capabilities"""
     original_search = searcher.search
 
+    # Memoized results for repeated identical queries (debounced typing
+    # re-issues the same search); the key includes a corpus fingerprint of
+    # (path, mtime, size) stats so file edits invalidate entries naturally
+    memo = OrderedDict()
+    memo_size = 64
+
+    def _memo_key(query, kwargs):
+        """Build a cache key, or None when the call is not cacheable"""
+        try:
+            arg_key = (query, tuple(sorted(kwargs.items())))
+            hash(arg_key)
+            search_dir = kwargs.get("search_dir")
+            if search_dir is None:
+                search_dir = Path.home() / ".claude" / "projects"
+            fingerprint = tuple(
+                (str(path), stat.st_mtime_ns, stat.st_size)
+                for path in sorted(Path(search_dir).rglob("*.jsonl"))
+                for stat in (path.stat(),)
+            )
+            return (arg_key, fingerprint)
+        except (TypeError, OSError):
+            return None
+
     def smart_search(query: str, **kwargs):
         """Smart search that automatically uses the best search mode"""
         # Remove mode parameter if provided
         kwargs.pop("mode", None)
+        # Optional allow-list restricting which strategies run
+        modes = kwargs.pop("modes", None)
+
+        memo_key = _memo_key(query, kwargs) if modes is None else None
+        if memo_key is not None and memo_key in memo:
+            memo.move_to_end(memo_key)
+            return list(memo[memo_key])
 
         # Try different search strategies
         results = []
 
         # 1. First try exact match (fast)
-        exact_results = original_search(query, mode="exact", **kwargs)
-        results.extend(exact_results)
+        if modes is None or "exact" in modes:
+            exact_results = original_search(query, mode="exact", **kwargs)
+            results.extend(exact_results)
 
         # 2. If query looks like regex, try regex search
-        if any(c in query for c in r".*+?[]{}()^$|\\"):
+        if (modes is None or "regex" in modes) and any(
+            c in query for c in r".*+?[]{}()^$|\\"
+        ):
             try:
                 regex_results = original_search(query, mode="regex", **kwargs)
                 # Add results not already found
@@ -478,14 +519,19 @@ def create_smart_searcher(searcher):
                 pass  # Invalid regex, skip
 
         # 3. Smart search for partial matches
-        smart_results = original_search(query, mode="smart", **kwargs)
-        existing_paths = {r.file_path for r in results}
-        for r in smart_results:
-            if r.file_path not in existing_paths:
-                results.append(r)
+        if modes is None or "smart" in modes:
+            smart_results = original_search(query, mode="smart", **kwargs)
+            existing_paths = {r.file_path for r in results}
+            for r in smart_results:
+                if r.file_path not in existing_paths:
+                    results.append(r)
 
         # 4. If semantic search is available, use it for better matches
-        if hasattr(searcher, "nlp") and searcher.nlp:
+        if (
+            (modes is None or "semantic" in modes)
+            and hasattr(searcher, "nlp")
+            and searcher.nlp
+        ):
             try:
                 semantic_results = original_search(query, mode="semantic", **kwargs)
                 existing_paths = {r.file_path for r in results}
@@ -511,7 +557,15 @@ def create_smart_searcher(searcher):
 
         # Limit results
         max_results = kwargs.get("max_results", 20)
-        return results[:max_results]
+        results = results[:max_results]
+
+        if memo_key is not None:
+            memo[memo_key] = results
+            if len(memo) > memo_size:
+                memo.popitem(last=False)
+            # Hand out a copy so callers cannot mutate the cached list
+            return list(results)
+        return results
 
     # Replace the search method
     searcher.search = smart_search
@@ -9,9 +9,384 @@ readable markdown files.
 
 import argparse
 import json
+import mmap
+import operator
+import os
+import re
+import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# Optional fast JSON parser: orjson parses raw bytes 2-3x faster than the
+# stdlib and dumps even faster. Everything falls back to stdlib json.
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+# Optional lazy (On-Demand) parser for preview scans: simdjson only
+# materializes the fields actually touched, so skipping over assistant/tool
+# lines costs almost nothing.
+try:
+    import simdjson
+
+    SIMDJSON_AVAILABLE = True
+except ImportError:
+    simdjson = None
+    SIMDJSON_AVAILABLE = False
+
+
+def _json_loads(data):
+    """Parse a JSON document from str or bytes with the fastest parser available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Lines above this size (giant tool blobs, pasted file contents) are routed
+# through the lazy parser when available, so unused fields never materialize
+_HUGE_LINE_THRESHOLD = 256 * 1024
+
+
+def _iter_jsonl_lines(f):
+    """Yield newline-delimited records as bytes, via mmap when possible.
+
+    Slicing the map hands the parser data straight off the mapped pages,
+    skipping the file iterator's per-line read buffering; empty files and
+    non-mappable streams fall back to plain iteration.
+    """
+    try:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (ValueError, OSError):
+        yield from f
+        return
+    try:
+        pos = 0
+        size = len(mm)
+        find = mm.find
+        while pos < size:
+            nl = find(b"\n", pos)
+            if nl == -1:
+                yield mm[pos:size]
+                break
+            yield mm[pos:nl + 1]
+            pos = nl + 1
+    finally:
+        mm.close()
+
+
+# Precompiled once: tag stripping runs on every preview line considered
+_TAG_RE = re.compile(r"<[^>]+>")
+
+# Single alternation covering every "not a real user message" phrase, so one
+# scan replaces a cascade of startswith/in/lower() passes
+_SKIP_RE = re.compile(
+    r"^tool_use_id|\[Request interrupted|session is being continued|is running.*…",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Leading "[Image #N]" references: drop the reference, keep trailing text
+_IMG_RE = re.compile(r"^\[Image #[^\]]*\]\s*")
+
+
+def _strip_tags(text: str) -> str:
+    """Remove XML-like tags; the membership guard skips the regex engine
+    entirely for the common tag-free case."""
+    if "<" not in text:
+        return text
+    return _TAG_RE.sub("", text)
+
+
+def _scandir_jsonl(path):
+    """Recursively yield DirEntry objects for *.jsonl files.
+
+    DirEntry caches the stat result gathered during the directory read,
+    halving syscalls versus rglob plus a per-file stat for sorting.
+    """
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _scandir_jsonl(entry.path)
+                elif entry.name.endswith(".jsonl"):
+                    yield entry
+    except OSError:
+        return
+
+
+def _count_remaining_lines(f) -> int:
+    """Count lines left in a binary file with a raw 64KB-chunk newline scan.
+
+    bytes.count is far cheaper than parsing JSON per line, and a final
+    unterminated line still counts as one.
+    """
+    count = 0
+    chunk = b""
+    while True:
+        prev = chunk
+        chunk = f.read(65536)
+        if not chunk:
+            if prev and not prev.endswith(b"\n"):
+                count += 1
+            return count
+        count += chunk.count(b"\n")
+
+
+def _json_dumps_pretty(obj) -> str:
+    """Serialize obj to 2-space-indented JSON text."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+# Single-pass HTML escaping table (vs three chained str.replace copies)
+_HTML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+# Static stylesheet and body opening for HTML exports, frozen once so each
+# export only formats the handful of dynamic header fields
+_HTML_STYLE_AND_OPEN = """\
+    <style>
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            line-height: 1.6;
+            color: #333;
+            max-width: 900px;
+            margin: 0 auto;
+            padding: 20px;
+            background: #f5f5f5;
+        }
+        .header {
+            background: white;
+            padding: 20px;
+            border-radius: 8px;
+            margin-bottom: 20px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        h1 {
+            color: #2c3e50;
+            margin: 0 0 10px 0;
+        }
+        .metadata {
+            color: #666;
+            font-size: 0.9em;
+        }
+        .message {
+            background: white;
+            padding: 15px 20px;
+            margin-bottom: 15px;
+            border-radius: 8px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        .user {
+            border-left: 4px solid #3498db;
+        }
+        .assistant {
+            border-left: 4px solid #2ecc71;
+        }
+        .tool_use {
+            border-left: 4px solid #f39c12;
+            background: #fffbf0;
+        }
+        .tool_result {
+            border-left: 4px solid #e74c3c;
+            background: #fff5f5;
+        }
+        .system {
+            border-left: 4px solid #95a5a6;
+            background: #f8f9fa;
+        }
+        .role {
+            font-weight: bold;
+            margin-bottom: 10px;
+            display: flex;
+            align-items: center;
+        }
+        .content {
+            white-space: pre-wrap;
+            word-wrap: break-word;
+        }
+        pre {
+            background: #f4f4f4;
+            padding: 10px;
+            border-radius: 4px;
+            overflow-x: auto;
+        }
+        code {
+            background: #f4f4f4;
+            padding: 2px 4px;
+            border-radius: 3px;
+            font-family: 'Courier New', monospace;
+        }
+    </style>
+</head>
+<body>
+"""
+
+
+def _fast_date_parts(ts: str) -> Tuple[str, str]:
+    """Split an ISO-8601 timestamp into (date, time) strings by slicing.
+
+    Session timestamps are consistently YYYY-MM-DDTHH:MM:SS..., so plain
+    slicing avoids the fromisoformat/strftime round-trip; anything else
+    falls back to real parsing.
+    """
+    if len(ts) >= 19 and ts[4] == "-" and ts[10] == "T":
+        return ts[:10], ts[11:19]
+    try:
+        dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
+        return dt.strftime("%Y-%m-%d"), dt.strftime("%H:%M:%S")
+    except Exception:
+        return datetime.now().strftime("%Y-%m-%d"), ""
+
+
+def _filename_parts(session_id: str, conversation) -> Tuple[str, str, str]:
+    """Compute (date_str, time_str, filename stem) for a conversation once.
+
+    Centralizes the first-timestamp fallback that each save_as_* method used
+    to duplicate, so multi-format exports parse the timestamp a single time.
+    """
+    first_timestamp = conversation[0].get("timestamp", "")
+    if first_timestamp:
+        date_str, time_str = _fast_date_parts(first_timestamp)
+    else:
+        date_str = datetime.now().strftime("%Y-%m-%d")
+        time_str = ""
+    return date_str, time_str, f"claude-conversation-{date_str}-{session_id[:8]}"
+
+
+# Static markdown role headers, built once instead of per message
+_MD_ROLE_HEADERS = {
+    "user": "## 👤 User\n\n",
+    "assistant": "## 🤖 Claude\n\n",
+    "tool_use": "### 🔧 Tool Use\n\n",
+    "tool_result": "### 📤 Tool Result\n\n",
+    "system": "### ℹ️ System\n\n",
+}
+
+
+# Type-indexed dispatch for content blocks; replaces a per-item if/elif chain
+_TEXT_HANDLERS = {
+    "text": lambda item: item.get("text", ""),
+    "tool_use": lambda item: (
+        f"\n🔧 Using tool: {item.get('name', 'unknown')}\n"
+        f"Input: {_json_dumps_pretty(item.get('input', {}))}\n"
+    ),
+}
+
+
+class Msg(NamedTuple):
+    """One conversation message as a tuple instead of a per-message dict.
+
+    Tuples are far cheaper to allocate and pack their fields contiguously;
+    string subscripting and .get are kept so existing dict-style consumers
+    (and callers passing plain dicts) keep working unchanged.
+    """
+
+    role: str
+    content: str
+    timestamp: str = ""
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+
+    def get(self, key, default=""):
+        return getattr(self, key, default)
+
+
+def _handle_user(entry, detailed, extract_text):
+    """Build a conversation record from a user entry, or None."""
+    if "message" not in entry:
+        return None
+    msg = entry["message"]
+    if isinstance(msg, dict) and msg.get("role") == "user":
+        text = extract_text(msg.get("content", ""))
+        if text and text.strip():
+            return Msg("user", text, entry.get("timestamp", ""))
+    return None
+
+
+def _handle_assistant(entry, detailed, extract_text):
+    """Build a conversation record from an assistant entry, or None."""
+    if "message" not in entry:
+        return None
+    msg = entry["message"]
+    if isinstance(msg, dict) and msg.get("role") == "assistant":
+        text = extract_text(msg.get("content", []), detailed=detailed)
+        if text and text.strip():
+            return Msg("assistant", text, entry.get("timestamp", ""))
+    return None
+
+
+def _handle_tool_use(entry, detailed, extract_text):
+    """Build a conversation record from a tool_use entry (detailed mode)."""
+    tool_data = entry.get("tool", {})
+    tool_name = tool_data.get("name", "unknown")
+    tool_input = tool_data.get("input", {})
+    return Msg(
+        "tool_use",
+        f"🔧 Tool: {tool_name}\nInput: {_json_dumps_pretty(tool_input)}",
+        entry.get("timestamp", ""),
+    )
+
+
+def _handle_tool_result(entry, detailed, extract_text):
+    """Build a conversation record from a tool_result entry (detailed mode)."""
+    result = entry.get("result", {})
+    output = result.get("output", "") or result.get("error", "")
+    return Msg("tool_result", f"📤 Result:\n{output}", entry.get("timestamp", ""))
+
+
+def _handle_system(entry, detailed, extract_text):
+    """Build a conversation record from a system entry (detailed mode)."""
+    if "message" not in entry:
+        return None
+    msg = entry.get("message", "")
+    if not msg:
+        return None
+    return Msg("system", f"ℹ️ System: {msg}", entry.get("timestamp", ""))
+
+
+# O(1) entry-type dispatch replacing the per-line if/elif chain; detailed
+# mode swaps in the table that also covers tool and system entries
+_ENTRY_HANDLERS = {"user": _handle_user, "assistant": _handle_assistant}
+_DETAILED_ENTRY_HANDLERS = {
+    **_ENTRY_HANDLERS,
+    "tool_use": _handle_tool_use,
+    "tool_result": _handle_tool_result,
+    "system": _handle_system,
+}
+
+
+# Per-process extractor used by parallel extraction workers
+_WORKER_EXTRACTOR = None
+
+
+def _init_extract_worker(output_dir):
+    """Build one quiet extractor per worker process."""
+    global _WORKER_EXTRACTOR
+    import contextlib
+    import io
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        _WORKER_EXTRACTOR = ClaudeConversationExtractor(output_dir)
+
+
+def _extract_and_save(session_path, session_stem, format, detailed):
+    """Extract and save a single session inside a worker process."""
+    conversation = _WORKER_EXTRACTOR.extract_conversation(session_path, detailed=detailed)
+    if not conversation:
+        return None, 0
+    output_path = _WORKER_EXTRACTOR.save_conversation(
+        conversation, session_stem, format=format
+    )
+    return output_path, len(conversation)
 
 
 class ClaudeConversationExtractor:
@@ -52,6 +427,29 @@ class ClaudeConversationExtractor:
 
         print(f"📁 Saving logs to: {self.output_dir}")
 
+        # Reused across preview scans so the parser buffer is allocated once
+        self._simdjson_parser = simdjson.Parser() if simdjson is not None else None
+        self._stat_cache = {}
+        # Parsed results memoized per (path, mtime) so listing then exporting
+        # the same session does not re-read and re-parse its file
+        self._preview_cache = {}
+        self._conversation_cache = {}
+
+    def _mtime_key(self, path: Path):
+        """Cache key that invalidates whenever the file is modified."""
+        try:
+            st = self._stat_cache.get(path) or path.stat()
+        except OSError:
+            return None
+        return str(path), st.st_mtime_ns
+
+    @staticmethod
+    def _cache_put(cache: dict, key, value, maxsize: int = 256):
+        """Insert into a bounded dict, evicting the oldest entry when full."""
+        if len(cache) >= maxsize:
+            cache.pop(next(iter(cache)))
+        cache[key] = value
+
     def find_sessions(self, project_path: Optional[str] = None) -> List[Path]:
         """Find all JSONL session files, sorted by most recent first."""
         if project_path:
@@ -59,99 +457,84 @@ class ClaudeConversationExtractor:
         else:
             search_dir = self.claude_dir
 
+        # Decorate with the cached DirEntry stat so each file is statted
+        # exactly once, then sort on the precomputed mtime
+        pairs = [(e.stat().st_mtime, e) for e in _scandir_jsonl(search_dir)]
+        pairs.sort(key=operator.itemgetter(0), reverse=True)
         sessions = []
-        if search_dir.exists():
-            for jsonl_file in search_dir.rglob("*.jsonl"):
-                sessions.append(jsonl_file)
-        return sorted(sessions, key=lambda x: x.stat().st_mtime, reverse=True)
+        for _, entry in pairs:
+            session_path = Path(entry.path)
+            sessions.append(session_path)
+            # Keep the cached stat so listing doesn't re-stat each file
+            self._stat_cache[session_path] = entry.stat()
+        return sessions
+
+    def find_sessions_by_names(self, names) -> Dict[str, Path]:
+        """Resolve session basenames to paths, stopping once all are found.
+
+        Cheaper than a full find_sessions walk when only a handful of files
+        (e.g. search hits) need resolving: no sort, no stat, and the scan
+        short-circuits as soon as every requested name is seen.
+        """
+        wanted = set(names)
+        found = {}
+        if not wanted:
+            return found
+        for entry in _scandir_jsonl(self.claude_dir):
+            if entry.name in wanted:
+                found[entry.name] = Path(entry.path)
+                if len(found) == len(wanted):
+                    break
+        return found
 
-    def extract_conversation(self, jsonl_path: Path, detailed: bool = False) -> List[Dict[str, str]]:
+    def extract_conversation(
+        self, jsonl_path: Path, detailed: bool = False, cache: bool = True
+    ) -> List[Dict[str, str]]:
         """Extract conversation messages from a JSONL file.
-        
+
         Args:
             jsonl_path: Path to the JSONL file
             detailed: If True, include tool use, MCP responses, and system messages
+            cache: If True, memoize the parsed conversation by (path, mtime)
         """
+        key = self._mtime_key(jsonl_path) if cache else None
+        if key is not None:
+            cached = self._conversation_cache.get((key, detailed))
+            if cached is not None:
+                return cached
+
         conversation = []
+        handlers = _DETAILED_ENTRY_HANDLERS if detailed else _ENTRY_HANDLERS
+        extract_text = self._extract_text_content
 
         try:
-            with open(jsonl_path, "r", encoding="utf-8") as f:
-                for line in f:
+            # Binary mode: the parser takes raw bytes, skipping a per-line
+            # UTF-8 decode pass
+            with open(jsonl_path, "rb") as f:
+                for line in _iter_jsonl_lines(f):
+                    if len(line) <= 1:  # blank line; skip without raising
+                        continue
                     try:
-                        entry = json.loads(line.strip())
-
-                        # Extract user messages
-                        if entry.get("type") == "user" and "message" in entry:
-                            msg = entry["message"]
-                            if isinstance(msg, dict) and msg.get("role") == "user":
-                                content = msg.get("content", "")
-                                text = self._extract_text_content(content)
-
-                                if text and text.strip():
-                                    conversation.append(
-                                        {
-                                            "role": "user",
-                                            "content": text,
-                                            "timestamp": entry.get("timestamp", ""),
-                                        }
-                                    )
-
-                        # Extract assistant messages
-                        elif entry.get("type") == "assistant" and "message" in entry:
-                            msg = entry["message"]
-                            if isinstance(msg, dict) and msg.get("role") == "assistant":
-                                content = msg.get("content", [])
-                                text = self._extract_text_content(content, detailed=detailed)
-
-                                if text and text.strip():
-                                    conversation.append(
-                                        {
-                                            "role": "assistant",
-                                            "content": text,
-                                            "timestamp": entry.get("timestamp", ""),
-                                        }
-                                    )
-                        
-                        # Include tool use and system messages if detailed mode
-                        elif detailed:
-                            # Extract tool use events
-                            if entry.get("type") == "tool_use":
-                                tool_data = entry.get("tool", {})
-                                tool_name = tool_data.get("name", "unknown")
-                                tool_input = tool_data.get("input", {})
-                                conversation.append(
-                                    {
-                                        "role": "tool_use",
-                                        "content": f"🔧 Tool: {tool_name}\nInput: {json.dumps(tool_input, indent=2)}",
-                                        "timestamp": entry.get("timestamp", ""),
-                                    }
-                                )
-                            
-                            # Extract tool results
-                            elif entry.get("type") == "tool_result":
-                                result = entry.get("result", {})
-                                output = result.get("output", "") or result.get("error", "")
-                                conversation.append(
-                                    {
-                                        "role": "tool_result",
-                                        "content": f"📤 Result:\n{output}",
-                                        "timestamp": entry.get("timestamp", ""),
-                                    }
-                                )
-                            
-                            # Extract system messages
-                            elif entry.get("type") == "system" and "message" in entry:
-                                msg = entry.get("message", "")
-                                if msg:
-                                    conversation.append(
-                                        {
-                                            "role": "system",
-                                            "content": f"ℹ️ System: {msg}",
-                                            "timestamp": entry.get("timestamp", ""),
-                                        }
-                                    )
-
-                    except json.JSONDecodeError:
+                        if (
+                            self._simdjson_parser is not None
+                            and len(line) > _HUGE_LINE_THRESHOLD
+                        ):
+                            # simdjson chews through oversized lines much
+                            # faster than the stdlib; as_dict() yields the
+                            # plain types the handlers expect and frees the
+                            # parser for the next line
+                            entry = self._simdjson_parser.parse(line).as_dict()
+                        else:
+                            entry = _json_loads(line)
+
+                        handler = handlers.get(entry.get("type"))
+                        if handler is None:
+                            continue
+                        record = handler(entry, detailed, extract_text)
+                        if record is not None:
+                            conversation.append(record)
+
+                    except ValueError:  # covers json and orjson decode errors
                         continue
                     except Exception:
                         # Silently skip problematic entries
@@ -160,6 +543,8 @@ class ClaudeConversationExtractor:
         except Exception as e:
             print(f"❌ Error reading file {jsonl_path}: {e}")
 
+        if key is not None and conversation:
+            self._cache_put(self._conversation_cache, (key, detailed), conversation)
         return conversation
 
     def _extract_text_content(self, content, detailed: bool = False) -> str:
@@ -174,16 +559,13 @@ class ClaudeConversationExtractor:
         elif isinstance(content, list):
             # Extract text from content array
             text_parts = []
+            handlers = _TEXT_HANDLERS
             for item in content:
                 if isinstance(item, dict):
-                    if item.get("type") == "text":
-                        text_parts.append(item.get("text", ""))
-                    elif detailed and item.get("type") == "tool_use":
-                        # Include tool use details in detailed mode
-                        tool_name = item.get("name", "unknown")
-                        tool_input = item.get("input", {})
-                        text_parts.append(f"\n🔧 Using tool: {tool_name}")
-                        text_parts.append(f"Input: {json.dumps(tool_input, indent=2)}\n")
+                    item_type = item.get("type")
+                    handler = handlers.get(item_type)
+                    if handler and (detailed or item_type == "text"):
+                        text_parts.append(handler(item))
             return "\n".join(text_parts)
         else:
             return str(content)
@@ -254,15 +636,20 @@ class ClaudeConversationExtractor:
                 lines = content.split('\n')
                 max_lines_per_msg = 50
                 
-                for line_idx, line in enumerate(lines[:max_lines_per_msg]):
+                # Buffer each page and emit it in one write instead of a
+                # print call (and flush) per line
+                page_buf = []
+                for line in lines[:max_lines_per_msg]:
                     # Wrap very long lines
                     if len(line) > 100:
                         line = line[:97] + "..."
-                    print(line)
+                    page_buf.append(line + "\n")
                     lines_shown += 1
-                    
+
                     # Check if we need to paginate
                     if lines_shown >= lines_per_page:
+                        sys.stdout.writelines(page_buf)
+                        page_buf.clear()
                         response = input("\n[Enter] Continue • [Q] Quit: ").strip().upper()
                         if response == "Q":
                             print("\n👋 Stopped viewing")
@@ -270,6 +657,8 @@ class ClaudeConversationExtractor:
                         # Clear screen for next page
                         print("\033[2J\033[H", end="")
                         lines_shown = 0
+                if page_buf:
+                    sys.stdout.writelines(page_buf)
                 
                 if len(lines) > max_lines_per_msg:
                     print(f"... [{len(lines) - max_lines_per_msg} more lines truncated]")
@@ -285,240 +674,124 @@ class ClaudeConversationExtractor:
             input("\nPress Enter to continue...")
 
     def save_as_markdown(
-        self, conversation: List[Dict[str, str]], session_id: str
+        self, conversation: List[Dict[str, str]], session_id: str, parts: Tuple = None
     ) -> Optional[Path]:
         """Save conversation as clean markdown file."""
         if not conversation:
             return None
 
-        # Get timestamp from first message
-        first_timestamp = conversation[0].get("timestamp", "")
-        if first_timestamp:
-            try:
-                # Parse ISO timestamp
-                dt = datetime.fromisoformat(first_timestamp.replace("Z", "+00:00"))
-                date_str = dt.strftime("%Y-%m-%d")
-                time_str = dt.strftime("%H:%M:%S")
-            except Exception:
-                date_str = datetime.now().strftime("%Y-%m-%d")
-                time_str = ""
-        else:
-            date_str = datetime.now().strftime("%Y-%m-%d")
-            time_str = ""
+        date_str, time_str, stem = parts or _filename_parts(session_id, conversation)
+        output_path = self.output_dir / f"{stem}.md"
 
-        filename = f"claude-conversation-{date_str}-{session_id[:8]}.md"
-        output_path = self.output_dir / filename
+        buf = ["# Claude Conversation Log\n\n"]
+        buf.append(f"Session ID: {session_id}\n")
+        buf.append(f"Date: {date_str}")
+        if time_str:
+            buf.append(f" {time_str}")
+        buf.append("\n\n---\n\n")
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write("# Claude Conversation Log\n\n")
-            f.write(f"Session ID: {session_id}\n")
-            f.write(f"Date: {date_str}")
-            if time_str:
-                f.write(f" {time_str}")
-            f.write("\n\n---\n\n")
+        headers = _MD_ROLE_HEADERS
+        for msg in conversation:
+            role = msg["role"]
+            buf.append(headers.get(role) or f"## {role}\n\n")
+            buf.append(f"{msg['content']}\n\n")
+            buf.append("---\n\n")
 
-            for msg in conversation:
-                role = msg["role"]
-                content = msg["content"]
-                
-                if role == "user":
-                    f.write("## 👤 User\n\n")
-                    f.write(f"{content}\n\n")
-                elif role == "assistant":
-                    f.write("## 🤖 Claude\n\n")
-                    f.write(f"{content}\n\n")
-                elif role == "tool_use":
-                    f.write("### 🔧 Tool Use\n\n")
-                    f.write(f"{content}\n\n")
-                elif role == "tool_result":
-                    f.write("### 📤 Tool Result\n\n")
-                    f.write(f"{content}\n\n")
-                elif role == "system":
-                    f.write("### ℹ️ System\n\n")
-                    f.write(f"{content}\n\n")
-                else:
-                    f.write(f"## {role}\n\n")
-                    f.write(f"{content}\n\n")
-                f.write("---\n\n")
+        # Encode the whole document once and flush it in a single write
+        output_path.write_bytes("".join(buf).encode("utf-8"))
 
         return output_path
     
     def save_as_json(
-        self, conversation: List[Dict[str, str]], session_id: str
+        self, conversation: List[Dict[str, str]], session_id: str, parts: Tuple = None
     ) -> Optional[Path]:
         """Save conversation as JSON file."""
         if not conversation:
             return None
 
-        # Get timestamp from first message
-        first_timestamp = conversation[0].get("timestamp", "")
-        if first_timestamp:
-            try:
-                dt = datetime.fromisoformat(first_timestamp.replace("Z", "+00:00"))
-                date_str = dt.strftime("%Y-%m-%d")
-            except Exception:
-                date_str = datetime.now().strftime("%Y-%m-%d")
-        else:
-            date_str = datetime.now().strftime("%Y-%m-%d")
+        date_str, _, stem = parts or _filename_parts(session_id, conversation)
+        output_path = self.output_dir / f"{stem}.json"
 
-        filename = f"claude-conversation-{date_str}-{session_id[:8]}.json"
-        output_path = self.output_dir / filename
-
-        # Create JSON structure
+        # Create JSON structure, rendering tuple messages to dicts only at
+        # the serialization boundary
         output = {
             "session_id": session_id,
             "date": date_str,
             "message_count": len(conversation),
-            "messages": conversation
+            "messages": [
+                m._asdict() if isinstance(m, Msg) else m for m in conversation
+            ]
         }
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(output, f, indent=2, ensure_ascii=False)
+        # Serialize fully in memory, then flush the document in one write;
+        # json.dump would trickle many small writes through the text layer
+        if orjson is not None:
+            buf = orjson.dumps(
+                output, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        else:
+            buf = json.dumps(output, indent=2, ensure_ascii=False).encode("utf-8")
+        output_path.write_bytes(buf)
 
         return output_path
     
     def save_as_html(
-        self, conversation: List[Dict[str, str]], session_id: str
+        self, conversation: List[Dict[str, str]], session_id: str, parts: Tuple = None
     ) -> Optional[Path]:
         """Save conversation as HTML file with syntax highlighting."""
         if not conversation:
             return None
 
-        # Get timestamp from first message
-        first_timestamp = conversation[0].get("timestamp", "")
-        if first_timestamp:
-            try:
-                dt = datetime.fromisoformat(first_timestamp.replace("Z", "+00:00"))
-                date_str = dt.strftime("%Y-%m-%d")
-                time_str = dt.strftime("%H:%M:%S")
-            except Exception:
-                date_str = datetime.now().strftime("%Y-%m-%d")
-                time_str = ""
-        else:
-            date_str = datetime.now().strftime("%Y-%m-%d")
-            time_str = ""
-
-        filename = f"claude-conversation-{date_str}-{session_id[:8]}.html"
-        output_path = self.output_dir / filename
+        date_str, time_str, stem = parts or _filename_parts(session_id, conversation)
+        output_path = self.output_dir / f"{stem}.html"
 
         # HTML template with modern styling
-        html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Claude Conversation - {session_id[:8]}</title>
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            line-height: 1.6;
-            color: #333;
-            max-width: 900px;
-            margin: 0 auto;
-            padding: 20px;
-            background: #f5f5f5;
-        }}
-        .header {{
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            margin-bottom: 20px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        h1 {{
-            color: #2c3e50;
-            margin: 0 0 10px 0;
-        }}
-        .metadata {{
-            color: #666;
-            font-size: 0.9em;
-        }}
-        .message {{
-            background: white;
-            padding: 15px 20px;
-            margin-bottom: 15px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        .user {{
-            border-left: 4px solid #3498db;
-        }}
-        .assistant {{
-            border-left: 4px solid #2ecc71;
-        }}
-        .tool_use {{
-            border-left: 4px solid #f39c12;
-            background: #fffbf0;
-        }}
-        .tool_result {{
-            border-left: 4px solid #e74c3c;
-            background: #fff5f5;
-        }}
-        .system {{
-            border-left: 4px solid #95a5a6;
-            background: #f8f9fa;
-        }}
-        .role {{
-            font-weight: bold;
-            margin-bottom: 10px;
-            display: flex;
-            align-items: center;
-        }}
-        .content {{
-            white-space: pre-wrap;
-            word-wrap: break-word;
-        }}
-        pre {{
-            background: #f4f4f4;
-            padding: 10px;
-            border-radius: 4px;
-            overflow-x: auto;
-        }}
-        code {{
-            background: #f4f4f4;
-            padding: 2px 4px;
-            border-radius: 3px;
-            font-family: 'Courier New', monospace;
-        }}
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>Claude Conversation Log</h1>
-        <div class="metadata">
-            <p>Session ID: {session_id}</p>
-            <p>Date: {date_str} {time_str}</p>
-            <p>Messages: {len(conversation)}</p>
-        </div>
-    </div>
-"""
+        # Only the title and metadata vary; the 3KB style block is the
+        # frozen module constant
+        buf = [
+            "<!DOCTYPE html>\n"
+            '<html lang="en">\n'
+            "<head>\n"
+            '    <meta charset="UTF-8">\n'
+            '    <meta name="viewport" content="width=device-width, initial-scale=1.0">\n'
+            f"    <title>Claude Conversation - {session_id[:8]}</title>\n",
+            _HTML_STYLE_AND_OPEN,
+            '    <div class="header">\n'
+            "        <h1>Claude Conversation Log</h1>\n"
+            '        <div class="metadata">\n'
+            f"            <p>Session ID: {session_id}</p>\n"
+            f"            <p>Date: {date_str} {time_str}</p>\n"
+            f"            <p>Messages: {len(conversation)}</p>\n"
+            "        </div>\n"
+            "    </div>\n",
+        ]
+
+        for msg in conversation:
+            role = msg["role"]
+            content = msg["content"]
+
+            # Escape HTML in a single translate pass
+            content = content.translate(_HTML_ESCAPE)
+
+            role_display = {
+                "user": "👤 User",
+                "assistant": "🤖 Claude",
+                "tool_use": "🔧 Tool Use",
+                "tool_result": "📤 Tool Result",
+                "system": "ℹ️ System"
+            }.get(role, role)
+
+            buf.append(
+                f'    <div class="message {role}">\n'
+                f'        <div class="role">{role_display}</div>\n'
+                f'        <div class="content">{content}</div>\n'
+                '    </div>\n'
+            )
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
-            
-            for msg in conversation:
-                role = msg["role"]
-                content = msg["content"]
-                
-                # Escape HTML
-                content = content.replace("&", "&amp;")
-                content = content.replace("<", "&lt;")
-                content = content.replace(">", "&gt;")
-                
-                role_display = {
-                    "user": "👤 User",
-                    "assistant": "🤖 Claude",
-                    "tool_use": "🔧 Tool Use",
-                    "tool_result": "📤 Tool Result",
-                    "system": "ℹ️ System"
-                }.get(role, role)
-                
-                f.write(f'    <div class="message {role}">\n')
-                f.write(f'        <div class="role">{role_display}</div>\n')
-                f.write(f'        <div class="content">{content}</div>\n')
-                f.write(f'    </div>\n')
-            
-            f.write("\n</body>\n</html>")
+        buf.append("\n</body>\n</html>")
+
+        # Encode the whole document once and flush it in a single write
+        output_path.write_bytes("".join(buf).encode("utf-8"))
 
         return output_path
 
@@ -532,28 +805,50 @@ class ClaudeConversationExtractor:
             session_id: Session identifier
             format: Output format ('markdown', 'json', 'html')
         """
+        if not conversation:
+            return None
+
+        # Compute the date prefix and filename stem once for every format
+        parts = _filename_parts(session_id, conversation)
         if format == "markdown":
-            return self.save_as_markdown(conversation, session_id)
+            return self.save_as_markdown(conversation, session_id, parts)
         elif format == "json":
-            return self.save_as_json(conversation, session_id)
+            return self.save_as_json(conversation, session_id, parts)
         elif format == "html":
-            return self.save_as_html(conversation, session_id)
+            return self.save_as_html(conversation, session_id, parts)
         else:
             print(f"❌ Unsupported format: {format}")
             return None
 
     def get_conversation_preview(self, session_path: Path) -> Tuple[str, int]:
         """Get a preview of the conversation's first real user message and message count."""
+        key = self._mtime_key(session_path)
+        if key is not None:
+            cached = self._preview_cache.get(key)
+            if cached is not None:
+                return cached
+
         try:
             first_user_msg = ""
             msg_count = 0
             
-            with open(session_path, 'r', encoding='utf-8') as f:
+            with open(session_path, "rb") as f:
                 for line in f:
                     msg_count += 1
+                    if first_user_msg:
+                        # Preview captured: the rest of the file only needs a
+                        # line count, not JSON parsing
+                        msg_count += _count_remaining_lines(f)
+                        break
                     if not first_user_msg:
                         try:
-                            data = json.loads(line)
+                            # as_dict() materializes to plain types so
+                            # isinstance checks work and the parser can be
+                            # reused on the next line
+                            if self._simdjson_parser is not None:
+                                data = self._simdjson_parser.parse(line).as_dict()
+                            else:
+                                data = _json_loads(line)
                             # Check for user message
                             if data.get("type") == "user" and "message" in data:
                                 msg = data["message"]
@@ -565,33 +860,18 @@ class ClaudeConversationExtractor:
                                         for item in content:
                                             if isinstance(item, dict) and item.get("type") == "text":
                                                 text = item.get("text", "").strip()
-                                                
-                                                # Skip tool results
-                                                if text.startswith("tool_use_id"):
-                                                    continue
-                                                
-                                                # Skip interruption messages
-                                                if "[Request interrupted" in text:
-                                                    continue
-                                                
-                                                # Skip Claude's session continuation messages
-                                                if "session is being continued" in text.lower():
+
+                                                # Skip tool results, interruptions,
+                                                # continuations and command output
+                                                if _SKIP_RE.search(text):
                                                     continue
-                                                
+
                                                 # Remove XML-like tags (command messages, etc)
-                                                import re
-                                                text = re.sub(r'<[^>]+>', '', text).strip()
-                                                
-                                                # Skip command outputs  
-                                                if "is running" in text and "…" in text:
-                                                    continue
-                                                
+                                                text = _strip_tags(text).strip()
+
                                                 # Handle image references - extract text after them
-                                                if text.startswith("[Image #"):
-                                                    parts = text.split("]", 1)
-                                                    if len(parts) > 1:
-                                                        text = parts[1].strip()
-                                                
+                                                text = _IMG_RE.sub("", text)
+
                                                 # If we have real user text, use it
                                                 if text and len(text) > 3:  # Lower threshold to catch "hello"
                                                     first_user_msg = text[:100].replace('\n', ' ')
@@ -599,28 +879,26 @@ class ClaudeConversationExtractor:
                                     
                                     # Handle string content (less common but possible)
                                     elif isinstance(content, str):
-                                        import re
                                         content = content.strip()
-                                        
-                                        # Remove XML-like tags
-                                        content = re.sub(r'<[^>]+>', '', content).strip()
-                                        
-                                        # Skip command outputs
-                                        if "is running" in content and "…" in content:
-                                            continue
-                                        
-                                        # Skip Claude's session continuation messages
-                                        if "session is being continued" in content.lower():
+
+                                        # Skip tool results, interruptions,
+                                        # continuations and command output
+                                        if _SKIP_RE.search(content):
                                             continue
-                                        
-                                        # Skip tool results and interruptions
-                                        if not content.startswith("tool_use_id") and "[Request interrupted" not in content:
-                                            if content and len(content) > 3:  # Lower threshold to catch short messages
-                                                first_user_msg = content[:100].replace('\n', ' ')
-                        except json.JSONDecodeError:
+
+                                        # Remove XML-like tags
+                                        content = _strip_tags(content).strip()
+
+                                        if content and len(content) > 3:  # Lower threshold to catch short messages
+                                            first_user_msg = content[:100].replace('\n', ' ')
+                        except ValueError:
+                            # Covers json.JSONDecodeError and simdjson errors
                             continue
-                            
-            return first_user_msg or "No preview available", msg_count
+
+            preview = (first_user_msg or "No preview available", msg_count)
+            if key is not None:
+                self._cache_put(self._preview_cache, key, preview)
+            return preview
         except Exception as e:
             return f"Error: {str(e)[:30]}", 0
 
@@ -645,11 +923,13 @@ class ClaudeConversationExtractor:
                 project = "~/" + "/".join(project.split()[2:]) if len(project.split()) > 2 else "Home"
             
             session_id = session.stem
-            modified = datetime.fromtimestamp(session.stat().st_mtime)
+            st = self._stat_cache.get(session)
+            if st is None:
+                st = session.stat()
+            modified = datetime.fromtimestamp(st.st_mtime)
 
             # Get file size
-            size = session.stat().st_size
-            size_kb = size / 1024
+            size_kb = st.st_size / 1024
             
             # Get preview and message count
             preview, msg_count = self.get_conversation_preview(session)
@@ -666,41 +946,88 @@ class ClaudeConversationExtractor:
         return sessions[:limit]
 
     def extract_multiple(
-        self, sessions: List[Path], indices: List[int], 
-        format: str = "markdown", detailed: bool = False
+        self, sessions: List[Path], indices: List[int],
+        format: str = "markdown", detailed: bool = False,
+        parallel: bool = False
     ) -> Tuple[int, int]:
         """Extract multiple sessions by index.
-        
+
         Args:
             sessions: List of session paths
             indices: Indices to extract
             format: Output format ('markdown', 'json', 'html')
             detailed: If True, include tool use and system messages
+            parallel: If True, distribute sessions across a process pool
         """
         success = 0
         total = len(indices)
 
+        valid_indices = []
         for idx in indices:
             if 0 <= idx < len(sessions):
-                session_path = sessions[idx]
-                conversation = self.extract_conversation(session_path, detailed=detailed)
-                if conversation:
-                    output_path = self.save_conversation(conversation, session_path.stem, format=format)
-                    success += 1
-                    msg_count = len(conversation)
-                    print(
-                        f"✅ {success}/{total}: {output_path.name} "
-                        f"({msg_count} messages)"
-                    )
-                else:
-                    print(f"⏭️  Skipped session {idx + 1} (no conversation)")
+                valid_indices.append(idx)
             else:
                 print(f"❌ Invalid session number: {idx + 1}")
 
+        if parallel and len(valid_indices) > 1:
+            from concurrent.futures import ProcessPoolExecutor, as_completed
+
+            with ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                initializer=_init_extract_worker,
+                initargs=(self.output_dir,),
+            ) as pool:
+                futures = {
+                    pool.submit(
+                        _extract_and_save,
+                        sessions[idx],
+                        sessions[idx].stem,
+                        format,
+                        detailed,
+                    ): idx
+                    for idx in valid_indices
+                }
+                for future in as_completed(futures):
+                    idx = futures[future]
+                    try:
+                        output_path, msg_count = future.result()
+                    except Exception:
+                        output_path, msg_count = None, 0
+                    if output_path:
+                        success += 1
+                        print(
+                            f"✅ {success}/{total}: {output_path.name} "
+                            f"({msg_count} messages)"
+                        )
+                    else:
+                        print(f"⏭️  Skipped session {idx + 1} (no conversation)")
+            return success, total
+
+        for idx in valid_indices:
+            session_path = sessions[idx]
+            conversation = self.extract_conversation(session_path, detailed=detailed)
+            if conversation:
+                output_path = self.save_conversation(conversation, session_path.stem, format=format)
+                success += 1
+                msg_count = len(conversation)
+                print(
+                    f"✅ {success}/{total}: {output_path.name} "
+                    f"({msg_count} messages)"
+                )
+            else:
+                print(f"⏭️  Skipped session {idx + 1} (no conversation)")
+
         return success, total
 
 
-def main():
+_PARSER = None
+
+
+def _build_parser():
+    """Construct the CLI argument parser once and reuse it across calls."""
+    global _PARSER
+    if _PARSER is not None:
+        return _PARSER
     parser = argparse.ArgumentParser(
         description="Extract Claude Code conversations to clean markdown files",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -786,8 +1113,12 @@ Examples:
         action="store_true",
         help="Include tool use, MCP responses, and system messages in export"
     )
+    _PARSER = parser
+    return parser
 
-    args = parser.parse_args()
+
+def main():
+    args = _build_parser().parse_args()
 
     # Handle interactive mode
     if args.interactive or (args.export and args.export.lower() == "logs"):
@@ -966,8 +1297,6 @@ Examples:
 
 def launch_interactive():
     """Launch the interactive UI directly, or handle search if specified."""
-    import sys
-
     # If no arguments provided, launch interactive UI
     if len(sys.argv) == 1:
         try:
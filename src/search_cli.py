@@ -4,7 +4,10 @@ Simple CLI search for Claude conversations without terminal control.
 This is used when running `claude-search` from the command line.
 """
 
+import io
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Handle both package and direct execution imports
 try:
@@ -18,6 +21,17 @@ except ImportError:
     from search_conversations import ConversationSearcher
 
 
+def prompt(msg: str) -> str:
+    """Show a prompt via a direct fd write so it appears without buffering lag."""
+    try:
+        os.write(sys.stdout.fileno(), msg.encode())
+    except (ValueError, OSError, io.UnsupportedOperation):
+        # stdout is redirected, captured, or otherwise not a real file;
+        # fall back to the plain prompt
+        return input(msg)
+    return input("")
+
+
 def main():
     """Main entry point for CLI search."""
     # Get search term from stdin or arguments
@@ -27,7 +41,7 @@ def main():
     else:
         # Prompt for search term
         try:
-            search_term = input("🔍 Enter search term: ").strip()
+            search_term = prompt("🔍 Enter search term: ").strip()
         except (EOFError, KeyboardInterrupt):
             print("\n👋 Search cancelled")
             return
@@ -47,40 +61,56 @@ def main():
     results = smart_searcher.search(search_term, max_results=20)
     
     if results:
-        print(f"\n✅ Found {len(results)} results across conversations:\n")
-        
-        # Group by file
+        # Accumulate the whole result listing and emit it with one write
+        # instead of a flushing print per line
+        out = [f"\n✅ Found {len(results)} results across conversations:\n\n"]
+
+        # Single pass: group by file, count matches, and keep the best match
+        # per file (stable tie-break), so no second scan or per-group sort
+        # is needed; group order stays sorted for deterministic output
         by_file = {}
         for result in results:
             fname = result.file_path.name
-            if fname not in by_file:
-                by_file[fname] = []
-            by_file[fname].append(result)
-        
+            entry = by_file.get(fname)
+            if entry is None:
+                by_file[fname] = [result, 1]
+            else:
+                entry[1] += 1
+                best = entry[0]
+                if (-result.relevance_score, result.conversation_id) < (
+                    -best.relevance_score,
+                    best.conversation_id,
+                ):
+                    entry[0] = result
+        groups = sorted(by_file.items())
+
         # Display results
         sessions = []
         session_paths = []
         extractor = ClaudeConversationExtractor()
-        all_sessions = extractor.find_sessions()
-        
-        for i, (fname, file_results) in enumerate(by_file.items(), 1):
+        # Resolve just the session files that matched; the scan stops as
+        # soon as every needed basename is found
+        needed = {result.file_path.name for result in results}
+        path_by_name = extractor.find_sessions_by_names(needed)
+
+        for i, (fname, (first, match_count)) in enumerate(groups, 1):
             session_id = fname.replace('.jsonl', '')
             sessions.append((fname, session_id))
-            
+
             # Find the actual file path
-            for session_path in all_sessions:
-                if session_path.name == fname:
-                    session_paths.append(session_path)
-                    break
-            
-            print(f"{i}. Session {session_id[:8]}... ({len(file_results)} matches)")
-            
-            # Show first match preview
-            first = file_results[0]
+            session_path = path_by_name.get(fname)
+            if session_path:
+                session_paths.append(session_path)
+
+            out.append(f"{i}. Session {session_id[:8]}... ({match_count} matches)\n")
+
+            # Show best match preview
             preview = first.matched_content[:150].replace('\n', ' ')
-            print(f"   {first.speaker}: {preview}...")
-            print()
-        
+            out.append(f"   {first.speaker}: {preview}...\n\n")
+
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
+
         # Offer to view or extract conversations
         if session_paths:
             print("\n" + "=" * 60)
@@ -90,7 +120,7 @@ def main():
             print("  Q. QUIT")
             
             try:
-                choice = input("\nYour choice: ").strip().upper()
+                choice = prompt("\nYour choice: ").strip().upper()
                 
                 if choice == 'V':
                     # View conversation
@@ -99,7 +129,7 @@ def main():
                         extractor.display_conversation(session_paths[0])
                         
                         # After viewing, offer to extract
-                        extract_choice = input("\n📤 Extract this conversation? (y/N): ").strip().lower()
+                        extract_choice = prompt("\n📤 Extract this conversation? (y/N): ").strip().lower()
                         if extract_choice == 'y':
                             conversation = extractor.extract_conversation(session_paths[0])
                             if conversation:
@@ -112,12 +142,12 @@ def main():
                             print(f"  {i}. {sid[:8]}...")
                         
                         try:
-                            view_num = int(input("\nEnter number (1-{}): ".format(len(sessions))))
+                            view_num = int(prompt("\nEnter number (1-{}): ".format(len(sessions))))
                             if 1 <= view_num <= len(session_paths):
                                 extractor.display_conversation(session_paths[view_num - 1])
                                 
                                 # After viewing, offer to extract
-                                extract_choice = input("\n📤 Extract this conversation? (y/N): ").strip().lower()
+                                extract_choice = prompt("\n📤 Extract this conversation? (y/N): ").strip().lower()
                                 if extract_choice == 'y':
                                     conversation = extractor.extract_conversation(session_paths[view_num - 1])
                                     if conversation:
@@ -127,13 +157,27 @@ def main():
                             print("❌ Invalid selection")
                 
                 elif choice == 'E':
-                    # Extract all found conversations
-                    for i, (session_path, (fname, sid)) in enumerate(zip(session_paths, sessions), 1):
-                        print(f"\n📤 Extracting session {i}...")
+                    # Extract all found conversations; threads overlap the
+                    # JSONL reads and markdown writes (the GIL is released
+                    # during I/O and orjson parsing)
+                    def _extract_one(session_path, sid):
                         conversation = extractor.extract_conversation(session_path)
                         if conversation:
-                            output = extractor.save_as_markdown(conversation, sid)
-                            print(f"✅ Saved: {output.name}")
+                            return extractor.save_as_markdown(conversation, sid)
+                        return None
+
+                    print(f"\n📤 Extracting {len(session_paths)} session(s)...")
+                    with ThreadPoolExecutor(
+                        max_workers=min(8, len(session_paths))
+                    ) as pool:
+                        futures = [
+                            pool.submit(_extract_one, session_path, sid)
+                            for session_path, (_, sid) in zip(session_paths, sessions)
+                        ]
+                        for future in as_completed(futures):
+                            output = future.result()
+                            if output:
+                                print(f"✅ Saved: {output.name}")
                 
                 elif choice == 'Q':
                     print("\n👋 Goodbye!")
@@ -13,11 +13,21 @@ Adapted from CAKE's conversation parser for Claude conversation search.
 """
 
 import json
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# Optional fast JSON parser: orjson parses small per-line documents several
+# times faster than the stdlib. Everything falls back to stdlib json.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Optional NLP imports for semantic search
 try:
@@ -30,6 +40,65 @@ except ImportError:
     print("      pip install spacy && python -m spacy download en_core_web_sm")
 
 
+def _json_loads(data):
+    """Parse a JSON document with the fastest parser available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_verbatim(needle: str) -> bool:
+    """True when the needle appears byte-for-byte inside JSON-encoded text.
+
+    json.dumps escapes quotes, backslashes, control characters and (by
+    default) non-ASCII, so only plain printable ASCII needles can be
+    searched for in the raw file bytes.
+    """
+    return (
+        needle.isascii()
+        and needle.isprintable()
+        and '"' not in needle
+        and "\\" not in needle
+    )
+
+
+@lru_cache(maxsize=128)
+def _load_records(path_str: str, mtime_ns: int, size: int) -> tuple:
+    """Parse a JSONL file into (line_number, entry) pairs, cached per file.
+
+    The mtime/size key makes edited files miss the cache automatically, so
+    repeat searches over an unchanged corpus parse each file only once per
+    process.
+    """
+    with open(path_str, "rb") as f:
+        data = f.read()
+
+    records = []
+    line_num = 0
+    for line in data.splitlines():
+        line_num += 1
+        try:
+            records.append((line_num, _json_loads(line)))
+        except ValueError:  # covers json and orjson decode errors
+            continue
+    return tuple(records)
+
+
+# Compiled-pattern cache shared across search calls, keyed by (pattern, flags);
+# repeated searches for the same query skip re.compile entirely
+_REGEX_CACHE: Dict[Tuple[str, int], "re.Pattern"] = {}
+
+
+def _compiled(pattern: str, flags: int = 0) -> "re.Pattern":
+    """Return a cached compiled regex (raises re.error on bad patterns)."""
+    key = (pattern, flags)
+    regex = _REGEX_CACHE.get(key)
+    if regex is None:
+        regex = re.compile(pattern, flags)
+        _REGEX_CACHE[key] = regex
+    return regex
+
+
 @dataclass
 class SearchResult:
     """Represents a search result with context"""
@@ -42,14 +111,34 @@ class SearchResult:
     timestamp: Optional[datetime] = None
     relevance_score: float = 0.0
     line_number: int = 0
+    preview: str = ""
+
+    def __post_init__(self):
+        # Pre-slice the display preview once at construction so repeated
+        # displays don't re-slice (potentially long) matched content
+        if not self.preview:
+            self.preview = self.matched_content[:100]
+
+    def summary_tokens(self) -> Tuple[str, str, str]:
+        """Return (filename, speaker, relevance) display tokens.
+
+        Cheaper than building the full __str__ banner when a caller only
+        needs the one-line summary pieces.
+        """
+        return (
+            self.file_path.name,
+            self.speaker.title(),
+            f"{self.relevance_score:.0%}",
+        )
 
     def __str__(self) -> str:
         """User-friendly string representation"""
+        name, speaker, relevance = self.summary_tokens()
         return (
             f"\n{'=' * 60}\n"
-            f"File: {self.file_path.name}\n"
-            f"Speaker: {self.speaker.title()}\n"
-            f"Relevance: {self.relevance_score:.0%}\n"
+            f"File: {name}\n"
+            f"Speaker: {speaker}\n"
+            f"Relevance: {relevance}\n"
             f"{'=' * 60}\n"
             f"{self.context}\n"
         )
@@ -135,6 +224,8 @@ class ConversationSearcher:
         speaker_filter: Optional[str] = None,
         max_results: int = 20,
         case_sensitive: bool = False,
+        sources: Optional[Iterable[Tuple[Path, List[Dict]]]] = None,
+        workers: Optional[int] = None,
     ) -> List[SearchResult]:
         """
         Search conversations with various filters.
@@ -148,57 +239,305 @@ class ConversationSearcher:
             speaker_filter: Filter by speaker - "human", "assistant", or None for both
             max_results: Maximum number of results to return
             case_sensitive: Whether search should be case-sensitive
+            sources: Optional (path, records) pairs to search instead of
+                reading JSONL files from search_dir; paths are used only to
+                label results
+            workers: Search this many files concurrently (default:
+                sequential); useful for large corpora on slow storage
 
         Returns:
             List of SearchResult objects sorted by relevance
         """
-        # Default search directory
+        # Return empty results for empty query
+        if not query or not query.strip():
+            return []
+
+        if sources is not None:
+            # In-memory records: no globbing, no mtime prefilter (message
+            # timestamps are still checked by the entry predicate)
+            file_records = [(Path(path), records) for path, records in sources]
+        else:
+            # Default search directory
+            if search_dir is None:
+                search_dir = Path.home() / ".claude" / "projects"
+
+            # Validate search directory
+            if not search_dir.exists():
+                raise ValueError(f"Search directory does not exist: {search_dir}")
+
+            # Find all JSONL files
+            jsonl_files = list(search_dir.rglob("*.jsonl"))
+            if not jsonl_files:
+                return []
+
+            # Apply date filtering to files if provided
+            if date_from or date_to:
+                jsonl_files = self._filter_files_by_date(
+                    jsonl_files, date_from, date_to
+                )
+
+            file_records = [(jsonl_file, None) for jsonl_file in jsonl_files]
+
+        # Compile/classify the query once, not per file or per message
+        compiled_query = self._compile_query(query, mode, case_sensitive)
+        if compiled_query is None:
+            return []
+
+        # Search based on mode
+        all_results = []
+
+        def _search_one(item):
+            jsonl_file, records = item
+            return self._search_file(
+                jsonl_file,
+                query,
+                mode,
+                speaker_filter,
+                case_sensitive,
+                date_from=date_from,
+                date_to=date_to,
+                compiled_query=compiled_query,
+                records=records,
+            )
+
+        if workers and workers > 1 and len(file_records) > 1:
+            # File-level parallelism: matching helpers are read-only and the
+            # parse cache is shared, so threads can each take a file
+            max_workers = min(workers, len(file_records))
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                for file_results in pool.map(_search_one, file_records):
+                    all_results.extend(file_results)
+        else:
+            for item in file_records:
+                all_results.extend(_search_one(item))
+
+        # Sort by relevance score
+        all_results.sort(key=lambda x: x.relevance_score, reverse=True)
+
+        # Return top results
+        return all_results[:max_results]
+
+    def search_iter(
+        self,
+        query: str,
+        search_dir: Optional[Path] = None,
+        mode: str = "smart",
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        speaker_filter: Optional[str] = None,
+        case_sensitive: bool = False,
+    ):
+        """
+        Stream search results file by file as they are found.
+
+        Unlike search(), results are not globally sorted by relevance; in
+        exchange the caller can display hits immediately and stop consuming
+        once it has enough, without materializing every match first.
+
+        Yields:
+            SearchResult objects in file-discovery order
+        """
         if search_dir is None:
             search_dir = Path.home() / ".claude" / "projects"
 
-        # Validate search directory
         if not search_dir.exists():
             raise ValueError(f"Search directory does not exist: {search_dir}")
 
-        # Return empty results for empty query
         if not query or not query.strip():
-            return []
+            return
 
-        # Find all JSONL files
         jsonl_files = list(search_dir.rglob("*.jsonl"))
-        if not jsonl_files:
-            return []
 
-        # Apply date filtering to files if provided
         if date_from or date_to:
             jsonl_files = self._filter_files_by_date(jsonl_files, date_from, date_to)
 
-        # Search based on mode
-        all_results = []
+        compiled_query = self._compile_query(query, mode, case_sensitive)
+        if compiled_query is None:
+            return
 
         for jsonl_file in jsonl_files:
-            if mode == "regex":
-                results = self._search_regex(
-                    jsonl_file, query, speaker_filter, case_sensitive
-                )
-            elif mode == "exact":
-                results = self._search_exact(
-                    jsonl_file, query, speaker_filter, case_sensitive
-                )
-            elif mode == "semantic" and self.nlp:
-                results = self._search_semantic(jsonl_file, query, speaker_filter)
-            else:  # smart mode - combines multiple approaches
-                results = self._search_smart(
-                    jsonl_file, query, speaker_filter, case_sensitive
+            yield from self._search_file(
+                jsonl_file,
+                query,
+                mode,
+                speaker_filter,
+                case_sensitive,
+                date_from=date_from,
+                date_to=date_to,
+                compiled_query=compiled_query,
+            )
+
+    def _search_file(
+        self,
+        jsonl_file: Path,
+        query: str,
+        mode: str,
+        speaker_filter: Optional[str],
+        case_sensitive: bool,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        compiled_query=None,
+        records: Optional[List[Dict]] = None,
+    ) -> List[SearchResult]:
+        """Search a single JSONL file (or pre-parsed records) using the given mode."""
+        # Predicates are pushed down into the matching loops so filtered-out
+        # messages never allocate a SearchResult
+        predicate = self._build_entry_predicate(speaker_filter, date_from, date_to)
+
+        if mode == "regex":
+            if compiled_query is None:
+                compiled_query = self._compile_query(query, mode, case_sensitive)
+            if compiled_query is None:
+                return []
+            kind, pattern = compiled_query
+            if kind == "literal":
+                # Metacharacter-free patterns use plain substring search,
+                # which is far faster than the regex engine
+                if records is None and self._can_skip_file(
+                    jsonl_file, pattern, case_sensitive
+                ):
+                    return []
+                return self._search_exact(
+                    jsonl_file, pattern, predicate, case_sensitive, records
                 )
+            return self._search_regex(
+                jsonl_file, pattern, predicate, case_sensitive, records
+            )
+        elif mode == "exact":
+            if records is None and self._can_skip_file(
+                jsonl_file, query, case_sensitive
+            ):
+                return []
+            return self._search_exact(
+                jsonl_file, query, predicate, case_sensitive, records
+            )
+        elif mode == "semantic" and self.nlp:
+            return self._search_semantic(jsonl_file, query, predicate, records)
+        else:  # smart mode - combines multiple approaches
+            return self._search_smart(
+                jsonl_file, query, predicate, case_sensitive, records
+            )
 
-            all_results.extend(results)
+    @staticmethod
+    def _can_skip_file(jsonl_file: Path, needle: str, case_sensitive: bool = False) -> bool:
+        """True when a cheap prefilter rules out a literal match.
 
-        # Sort by relevance score
-        all_results.sort(key=lambda x: x.relevance_score, reverse=True)
+        Case-sensitive queries that survive JSON encoding verbatim are
+        checked with bytes.find against the raw file, skipping parsing
+        altogether for non-matching files. Everything else falls back to
+        the per-file trigram set, a necessary condition only: a missing
+        query trigram proves the file cannot match.
+        """
+        if len(needle) < 3:
+            return False
 
-        # Return top results
-        return all_results[:max_results]
+        if case_sensitive and _json_verbatim(needle):
+            try:
+                raw = Path(jsonl_file).read_bytes()
+            except OSError:
+                return False
+            return raw.find(needle.encode("utf-8")) < 0
+
+        try:
+            st = os.stat(jsonl_file)
+        except OSError:
+            return False
+        trigrams = _file_trigrams(str(jsonl_file), st.st_mtime_ns, st.st_size)
+        lowered = needle.lower()
+        return any(
+            lowered[i:i + 3] not in trigrams for i in range(len(lowered) - 2)
+        )
+
+    @staticmethod
+    def _iter_entries(jsonl_file: Path, records: Optional[List[Dict]] = None):
+        """Yield (line_number, entry) pairs from records or from disk."""
+        if records is not None:
+            yield from enumerate(records, 1)
+            return
+
+        # Parsed files are cached by (path, mtime, size), so the multi-mode
+        # smart searcher and repeat queries parse each file at most once
+        st = os.stat(jsonl_file)
+        yield from _load_records(str(jsonl_file), st.st_mtime_ns, st.st_size)
+
+    def _build_entry_predicate(
+        self,
+        speaker_filter: Optional[str],
+        date_from: Optional[datetime],
+        date_to: Optional[datetime],
+    ):
+        """Build a (speaker, timestamp) -> bool predicate for the match loops.
+
+        The allowed-speaker set is precomputed once, so each message pays a
+        single membership check. Messages whose own timestamp parses and
+        falls outside the date range are rejected; messages without a
+        timestamp rely on the coarser file-mtime prefilter.
+        """
+        allowed_speakers = (
+            frozenset((speaker_filter,)) if speaker_filter else None
+        )
+
+        def predicate(speaker, timestamp):
+            if allowed_speakers is not None and speaker not in allowed_speakers:
+                return False
+            if timestamp is not None and (date_from or date_to):
+                # Normalize aware timestamps for comparison with naive bounds
+                ts = timestamp.replace(tzinfo=None) if timestamp.tzinfo else timestamp
+                if date_from and ts < date_from:
+                    return False
+                if date_to and ts > date_to:
+                    return False
+            return True
+
+        return predicate
+
+    def _compile_query(self, query: str, mode: str, case_sensitive: bool):
+        """Classify and compile the query once per search call.
+
+        Returns ("literal", needle) when plain substring search suffices,
+        ("regex", compiled_pattern) for real patterns, or None when the
+        pattern fails to compile.
+        """
+        if mode == "regex":
+            if re.escape(query) == query:
+                return ("literal", query)
+            try:
+                flags = 0 if case_sensitive else re.IGNORECASE
+                return ("regex", _compiled(query, flags))
+            except re.error as e:
+                print(f"Invalid regex pattern: {e}")
+                return None
+        return ("literal", query)
+
+    @staticmethod
+    def _entry_timestamp(entry: Dict) -> Optional[datetime]:
+        """Parse an entry's timestamp, returning None when absent/invalid."""
+        timestamp_str = entry.get("timestamp")
+        if not timestamp_str:
+            return None
+
+        # Fast path for the fixed "YYYY-MM-DDTHH:MM:SSZ" layout session
+        # files use; direct integer slicing beats fromisoformat severalfold.
+        # Anything else (offsets, fractional seconds) takes the slow path.
+        if len(timestamp_str) == 20 and timestamp_str.endswith("Z"):
+            try:
+                return datetime(
+                    int(timestamp_str[0:4]),
+                    int(timestamp_str[5:7]),
+                    int(timestamp_str[8:10]),
+                    int(timestamp_str[11:13]),
+                    int(timestamp_str[14:16]),
+                    int(timestamp_str[17:19]),
+                    tzinfo=timezone.utc,
+                )
+            except ValueError:
+                return None
+
+        try:
+            return datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
+        except ValueError:
+            pass
+        return None
 
     def _filter_files_by_date(
         self,
@@ -225,8 +564,9 @@ class ConversationSearcher:
         self,
         jsonl_file: Path,
         query: str,
-        speaker_filter: Optional[str],
+        predicate,
         case_sensitive: bool,
+        records: Optional[List[Dict]] = None,
     ) -> List[SearchResult]:
         """
         Smart search that combines multiple techniques.
@@ -243,66 +583,52 @@ class ConversationSearcher:
         else:
             query_tokens = set(query.split()) - self.stop_words
 
-        # Read and parse JSONL
         try:
-            with open(jsonl_file, "r", encoding="utf-8") as f:
-                line_num = 0
-                for line in f:
-                    line_num += 1
-                    try:
-                        entry = json.loads(line.strip())
-
-                        # Extract message based on entry type
-                        if entry.get("type") in ["user", "assistant"]:
-                            speaker = (
-                                "human" if entry["type"] == "user" else "assistant"
-                            )
-
-                            # Apply speaker filter
-                            if speaker_filter and speaker != speaker_filter:
-                                continue
+            for line_num, entry in self._iter_entries(jsonl_file, records):
+                # Extract message based on entry type
+                if entry.get("type") in ["user", "assistant"]:
+                    speaker = "human" if entry["type"] == "user" else "assistant"
+
+                    # Apply speaker/date predicates before any matching work
+                    timestamp = self._entry_timestamp(entry)
+                    if not predicate(speaker, timestamp):
+                        continue
 
-                            # Extract content
-                            content = self._extract_content(entry)
-                            if not content:
-                                continue
+                    # Extract content
+                    content = self._extract_content(entry)
+                    if not content:
+                        continue
 
-                            # Calculate relevance
-                            relevance = self._calculate_relevance(
-                                content, query, query_tokens, case_sensitive
+                    # Calculate relevance
+                    relevance = self._calculate_relevance(
+                        content,
+                        query,
+                        query_tokens,
+                        case_sensitive,
+                        content_lower=(
+                            None
+                            if case_sensitive
+                            else self._content_lower(
+                                entry, content, memoize=records is None
                             )
-
-                            if relevance > 0.1:  # Threshold for inclusion
-                                # Extract context
-                                context = self._extract_context(
-                                    content, query, case_sensitive
-                                )
-
-                                # Parse timestamp if present
-                                timestamp = None
-                                timestamp_str = entry.get("timestamp")
-                                if timestamp_str:
-                                    try:
-                                        timestamp = datetime.fromisoformat(
-                                            timestamp_str.replace("Z", "+00:00")
-                                        )
-                                    except ValueError:
-                                        pass
-
-                                result = SearchResult(
-                                    file_path=jsonl_file,
-                                    conversation_id=conversation_id,
-                                    matched_content=content[:200],
-                                    context=context,
-                                    speaker=speaker,
-                                    timestamp=timestamp,
-                                    relevance_score=relevance,
-                                    line_number=line_num,
-                                )
-                                results.append(result)
-
-                    except json.JSONDecodeError:
-                        continue
+                        ),
+                    )
+
+                    if relevance > 0.1:  # Threshold for inclusion
+                        # Extract context
+                        context = self._extract_context(content, query, case_sensitive)
+
+                        result = SearchResult(
+                            file_path=jsonl_file,
+                            conversation_id=conversation_id,
+                            matched_content=content[:200],
+                            context=context,
+                            speaker=speaker,
+                            timestamp=timestamp,
+                            relevance_score=relevance,
+                            line_number=line_num,
+                        )
+                        results.append(result)
 
         except Exception as e:
             print(f"Error searching {jsonl_file}: {e}")
@@ -313,8 +639,9 @@ class ConversationSearcher:
         self,
         jsonl_file: Path,
         query: str,
-        speaker_filter: Optional[str],
+        predicate,
         case_sensitive: bool,
+        records: Optional[List[Dict]] = None,
     ) -> List[SearchResult]:
         """Exact string matching search."""
         results = []
@@ -323,64 +650,43 @@ class ConversationSearcher:
         search_query = query if case_sensitive else query.lower()
 
         try:
-            with open(jsonl_file, "r", encoding="utf-8") as f:
-                line_num = 0
-                for line in f:
-                    line_num += 1
-                    try:
-                        entry = json.loads(line.strip())
-
-                        if entry.get("type") in ["user", "assistant"]:
-                            speaker = (
-                                "human" if entry["type"] == "user" else "assistant"
-                            )
+            for line_num, entry in self._iter_entries(jsonl_file, records):
+                if entry.get("type") in ["user", "assistant"]:
+                    speaker = "human" if entry["type"] == "user" else "assistant"
 
-                            if speaker_filter and speaker != speaker_filter:
-                                continue
-
-                            content = self._extract_content(entry)
-                            if not content:
-                                continue
-
-                            search_content = (
-                                content if case_sensitive else content.lower()
-                            )
+                    timestamp = self._entry_timestamp(entry)
+                    if not predicate(speaker, timestamp):
+                        continue
 
-                            if search_query in search_content:
-                                # Calculate relevance based on match frequency
-                                match_count = search_content.count(search_query)
-                                relevance = min(1.0, match_count * 0.2)
-
-                                context = self._extract_context(
-                                    content, query, case_sensitive
-                                )
-
-                                # Parse timestamp if present
-                                timestamp = None
-                                timestamp_str = entry.get("timestamp")
-                                if timestamp_str:
-                                    try:
-                                        timestamp = datetime.fromisoformat(
-                                            timestamp_str.replace("Z", "+00:00")
-                                        )
-                                    except ValueError:
-                                        pass
-
-                                result = SearchResult(
-                                    file_path=jsonl_file,
-                                    conversation_id=conversation_id,
-                                    matched_content=content[:200],
-                                    context=context,
-                                    speaker=speaker,
-                                    timestamp=timestamp,
-                                    relevance_score=relevance,
-                                    line_number=line_num,
-                                )
-                                results.append(result)
-
-                    except json.JSONDecodeError:
+                    content = self._extract_content(entry)
+                    if not content:
                         continue
 
+                    search_content = (
+                        content
+                        if case_sensitive
+                        else self._content_lower(entry, content, memoize=records is None)
+                    )
+
+                    if search_query in search_content:
+                        # Calculate relevance based on match frequency
+                        match_count = search_content.count(search_query)
+                        relevance = min(1.0, match_count * 0.2)
+
+                        context = self._extract_context(content, query, case_sensitive)
+
+                        result = SearchResult(
+                            file_path=jsonl_file,
+                            conversation_id=conversation_id,
+                            matched_content=content[:200],
+                            context=context,
+                            speaker=speaker,
+                            timestamp=timestamp,
+                            relevance_score=relevance,
+                            line_number=line_num,
+                        )
+                        results.append(result)
+
         except Exception as e:
             print(f"Error searching {jsonl_file}: {e}")
 
@@ -389,87 +695,63 @@ class ConversationSearcher:
     def _search_regex(
         self,
         jsonl_file: Path,
-        pattern: str,
-        speaker_filter: Optional[str],
+        regex,
+        predicate,
         case_sensitive: bool,
+        records: Optional[List[Dict]] = None,
     ) -> List[SearchResult]:
-        """Regex pattern matching search."""
+        """Regex pattern matching search with a precompiled pattern."""
         results = []
         conversation_id = jsonl_file.stem
 
-        # Compile regex pattern
         try:
-            flags = 0 if case_sensitive else re.IGNORECASE
-            regex = re.compile(pattern, flags)
-        except re.error as e:
-            print(f"Invalid regex pattern: {e}")
-            return []
-
-        try:
-            with open(jsonl_file, "r", encoding="utf-8") as f:
-                line_num = 0
-                for line in f:
-                    line_num += 1
-                    try:
-                        entry = json.loads(line.strip())
+            for line_num, entry in self._iter_entries(jsonl_file, records):
+                if entry.get("type") in ["user", "assistant"]:
+                    speaker = "human" if entry["type"] == "user" else "assistant"
 
-                        if entry.get("type") in ["user", "assistant"]:
-                            speaker = (
-                                "human" if entry["type"] == "user" else "assistant"
-                            )
+                    timestamp = self._entry_timestamp(entry)
+                    if not predicate(speaker, timestamp):
+                        continue
 
-                            if speaker_filter and speaker != speaker_filter:
-                                continue
-
-                            content = self._extract_content(entry)
-                            if not content:
-                                continue
-
-                            matches = list(regex.finditer(content))
-
-                            if matches:
-                                # Calculate relevance based on match quality
-                                relevance = min(1.0, len(matches) * 0.2)
-
-                                # Get context around first match
-                                first_match = matches[0]
-                                start = max(0, first_match.start() - 100)
-                                end = min(len(content), first_match.end() + 100)
-                                context = "..." + content[start:end] + "..."
-
-                                # Parse timestamp if present
-                                timestamp = None
-                                timestamp_str = entry.get("timestamp")
-                                if timestamp_str:
-                                    try:
-                                        timestamp = datetime.fromisoformat(
-                                            timestamp_str.replace("Z", "+00:00")
-                                        )
-                                    except ValueError:
-                                        pass
-
-                                result = SearchResult(
-                                    file_path=jsonl_file,
-                                    conversation_id=conversation_id,
-                                    matched_content=first_match.group(),
-                                    context=context,
-                                    speaker=speaker,
-                                    timestamp=timestamp,
-                                    relevance_score=relevance,
-                                    line_number=line_num,
-                                )
-                                results.append(result)
-
-                    except json.JSONDecodeError:
+                    content = self._extract_content(entry)
+                    if not content:
                         continue
 
+                    matches = list(regex.finditer(content))
+
+                    if matches:
+                        # Calculate relevance based on match quality
+                        relevance = min(1.0, len(matches) * 0.2)
+
+                        # Get context around first match
+                        first_match = matches[0]
+                        start = max(0, first_match.start() - 100)
+                        end = min(len(content), first_match.end() + 100)
+                        context = "..." + content[start:end] + "..."
+
+                        result = SearchResult(
+                            file_path=jsonl_file,
+                            conversation_id=conversation_id,
+                            matched_content=first_match.group(),
+                            context=context,
+                            speaker=speaker,
+                            timestamp=timestamp,
+                            relevance_score=relevance,
+                            line_number=line_num,
+                        )
+                        results.append(result)
+
         except Exception as e:
             print(f"Error searching {jsonl_file}: {e}")
 
         return results
 
     def _search_semantic(
-        self, jsonl_file: Path, query: str, speaker_filter: Optional[str]
+        self,
+        jsonl_file: Path,
+        query: str,
+        predicate,
+        records: Optional[List[Dict]] = None,
     ) -> List[SearchResult]:
         """
         Semantic search using spaCy NLP.
@@ -489,68 +771,64 @@ class ConversationSearcher:
         ]
 
         try:
-            with open(jsonl_file, "r", encoding="utf-8") as f:
-                line_num = 0
-                for line in f:
-                    line_num += 1
-                    try:
-                        entry = json.loads(line.strip())
+            for line_num, entry in self._iter_entries(jsonl_file, records):
+                if entry.get("type") in ["user", "assistant"]:
+                    speaker = "human" if entry["type"] == "user" else "assistant"
 
-                        if entry.get("type") in ["user", "assistant"]:
-                            speaker = (
-                                "human" if entry["type"] == "user" else "assistant"
-                            )
-
-                            if speaker_filter and speaker != speaker_filter:
-                                continue
-
-                            content = self._extract_content(entry)
-                            if not content:
-                                continue
-
-                            # Process content with spaCy
-                            content_doc = self.nlp(content.lower())
-
-                            # Calculate semantic similarity
-                            similarity = self._calculate_semantic_similarity(
-                                query_doc, query_tokens, content_doc
-                            )
+                    timestamp = self._entry_timestamp(entry)
+                    if not predicate(speaker, timestamp):
+                        continue
 
-                            if similarity > 0.3:  # Threshold for semantic matches
-                                context = self._extract_context(content, query, False)
-
-                                # Parse timestamp if present
-                                timestamp = None
-                                timestamp_str = entry.get("timestamp")
-                                if timestamp_str:
-                                    try:
-                                        timestamp = datetime.fromisoformat(
-                                            timestamp_str.replace("Z", "+00:00")
-                                        )
-                                    except ValueError:
-                                        pass
-
-                                result = SearchResult(
-                                    file_path=jsonl_file,
-                                    conversation_id=conversation_id,
-                                    matched_content=content[:200],
-                                    context=context,
-                                    speaker=speaker,
-                                    timestamp=timestamp,
-                                    relevance_score=similarity,
-                                    line_number=line_num,
-                                )
-                                results.append(result)
-
-                    except json.JSONDecodeError:
+                    content = self._extract_content(entry)
+                    if not content:
                         continue
 
+                    # Process content with spaCy
+                    content_doc = self.nlp(content.lower())
+
+                    # Calculate semantic similarity
+                    similarity = self._calculate_semantic_similarity(
+                        query_doc, query_tokens, content_doc
+                    )
+
+                    if similarity > 0.3:  # Threshold for semantic matches
+                        context = self._extract_context(content, query, False)
+
+                        result = SearchResult(
+                            file_path=jsonl_file,
+                            conversation_id=conversation_id,
+                            matched_content=content[:200],
+                            context=context,
+                            speaker=speaker,
+                            timestamp=timestamp,
+                            relevance_score=similarity,
+                            line_number=line_num,
+                        )
+                        results.append(result)
+
         except Exception as e:
             print(f"Error searching {jsonl_file}: {e}")
 
         return results
 
-    def _extract_content(self, entry: Dict) -> str:
+    @staticmethod
+    def _content_lower(entry: Dict, content: str, memoize: bool = True) -> str:
+        """Return the lowercased content, cached on the entry dict.
+
+        Parsed entries persist in the per-file cache across searches, so
+        each message is lowered once rather than once per query. Pass
+        memoize=False for caller-owned records (the sources= kwarg) so
+        their dicts are never mutated.
+        """
+        cached = entry.get("_content_lower")
+        if cached is None:
+            cached = content.lower()
+            if memoize:
+                entry["_content_lower"] = cached
+        return cached
+
+    @staticmethod
+    def _extract_content(entry: Dict) -> str:
         """Extract text content from a JSONL entry."""
         # Handle test format (type: user/assistant, content: string)
         if entry.get("type") in ["user", "assistant"] and "content" in entry:
@@ -580,7 +858,12 @@ class ConversationSearcher:
         return ""
 
     def _calculate_relevance(
-        self, content: str, query: str, query_tokens: Set[str], case_sensitive: bool
+        self,
+        content: str,
+        query: str,
+        query_tokens: Set[str],
+        case_sensitive: bool,
+        content_lower: Optional[str] = None,
     ) -> float:
         """
         Calculate relevance score for content against query.
@@ -590,12 +873,15 @@ class ConversationSearcher:
         - Token overlap
         - Proximity of terms
         - Match density
+
+        Callers may pass a precomputed content_lower to skip re-lowering.
         """
         relevance = 0.0
 
         # Prepare content
         if not case_sensitive:
-            content_lower = content.lower()
+            if content_lower is None:
+                content_lower = content.lower()
             query_lower = query.lower()
         else:
             content_lower = content
@@ -689,7 +975,7 @@ class ConversationSearcher:
         # Highlight the match
         if not case_sensitive:
             # Case-insensitive replacement
-            pattern = re.compile(re.escape(query), re.IGNORECASE)
+            pattern = _compiled(re.escape(query), re.IGNORECASE)
             context = pattern.sub(f"**{query.upper()}**", context)
         else:
             context = context.replace(query, f"**{query}**")
@@ -723,11 +1009,11 @@ class ConversationSearcher:
             with open(jsonl_file, "r", encoding="utf-8") as f:
                 for line in f:
                     try:
-                        entry = json.loads(line.strip())
+                        entry = _json_loads(line.strip())
                         content = self._extract_content(entry)
                         if content:
                             all_content.append(content)
-                    except json.JSONDecodeError:
+                    except ValueError:
                         continue
         except Exception:
             return []
@@ -757,6 +1043,19 @@ class ConversationSearcher:
         return [phrase for phrase, count in sorted_phrases[:max_topics] if count > 1]
 
 
+@lru_cache(maxsize=128)
+def _file_trigrams(path_str: str, mtime_ns: int, size: int) -> frozenset:
+    """Lowercased trigram set over a file's message contents, cached per file."""
+    trigrams = set()
+    for _line_num, entry in _load_records(path_str, mtime_ns, size):
+        if entry.get("type") in ("user", "assistant"):
+            content = ConversationSearcher._extract_content(entry)
+            if content:
+                lowered = content.lower()
+                trigrams.update(lowered[i:i + 3] for i in range(len(lowered) - 2))
+    return frozenset(trigrams)
+
+
 def create_search_index(search_dir: Path, output_file: Path) -> None:
     """
     Create a search index for faster subsequent searches.
@@ -786,7 +1085,7 @@ def create_search_index(search_dir: Path, output_file: Path) -> None:
             with open(jsonl_file, "r", encoding="utf-8") as f:
                 for line in f:
                     try:
-                        entry = json.loads(line.strip())
+                        entry = _json_loads(line.strip())
                         if entry.get("type") in ["user", "assistant"]:
                             metadata["message_count"] += 1
                             speaker = (
@@ -798,7 +1097,7 @@ def create_search_index(search_dir: Path, output_file: Path) -> None:
                                 metadata["first_message"] = entry.get("timestamp")
                             metadata["last_message"] = entry.get("timestamp")
 
-                    except json.JSONDecodeError:
+                    except ValueError:
                         continue
         except Exception:
             continue
@@ -1,9 +1,11 @@
 """Pytest configuration for Claude Conversation Extractor tests."""
 
+import os
 import sys
-from pathlib import Path
 
-# Add src directory to Python path for testing
-src_dir = Path(__file__).parent.parent / "src"
-if str(src_dir) not in sys.path:
-    sys.path.insert(0, str(src_dir))
\ No newline at end of file
+# Add src (package modules) and this directory (fixtures) to the path once
+# per collection, so individual test modules need no sys.path edits
+_tests_dir = os.path.dirname(os.path.abspath(__file__))
+for _dir in (os.path.join(os.path.dirname(_tests_dir), "src"), _tests_dir):
+    if _dir not in sys.path:
+        sys.path.insert(0, _dir)
@@ -3,7 +3,10 @@
 Sample conversations for testing search functionality
 """
 
+import hashlib
 import json
+import os
+import shutil
 import tempfile
 from pathlib import Path
 
@@ -123,38 +126,61 @@ class ConversationFixtures:
     """Helper class to create test conversation files"""
 
     @staticmethod
-    def create_test_environment():
-        """Create a temporary directory with sample conversations"""
-        temp_dir = tempfile.mkdtemp()
-        claude_dir = Path(temp_dir) / ".claude" / "projects"
-
-        # Create conversations in different project directories
+    def _layout():
+        """Yield (project, conversation) pairs in a fixed order"""
         projects = ["python_help", "web_dev", "data_science"]
-
-        all_files = []
         conversation_idx = 0
 
         for project in projects:
-            project_dir = claude_dir / project
-            project_dir.mkdir(parents=True)
-
-            # Create 1-2 conversations per project
-            for i in range(min(2, len(SAMPLE_CONVERSATIONS) - conversation_idx)):
+            # 1-2 conversations per project
+            for _ in range(min(2, len(SAMPLE_CONVERSATIONS) - conversation_idx)):
                 if conversation_idx >= len(SAMPLE_CONVERSATIONS):
                     break
+                yield project, SAMPLE_CONVERSATIONS[conversation_idx]
+                conversation_idx += 1
 
-                conv_data = SAMPLE_CONVERSATIONS[conversation_idx]
-                chat_file = project_dir / f"chat_{conv_data['id']}.jsonl"
+    @staticmethod
+    def _build_environment(base_dir):
+        """Write the sample conversations as JSONL under base_dir"""
+        claude_dir = Path(base_dir) / ".claude" / "projects"
 
-                # Write messages as JSONL
-                with open(chat_file, "w") as f:
-                    for msg in conv_data["messages"]:
-                        f.write(json.dumps(msg) + "\n")
+        for project, conv_data in ConversationFixtures._layout():
+            project_dir = claude_dir / project
+            project_dir.mkdir(parents=True, exist_ok=True)
+            chat_file = project_dir / f"chat_{conv_data['id']}.jsonl"
 
-                all_files.append(chat_file)
-                conversation_idx += 1
+            with open(chat_file, "w") as f:
+                for msg in conv_data["messages"]:
+                    f.write(json.dumps(msg) + "\n")
 
-        return temp_dir, all_files
+    @staticmethod
+    def create_test_environment():
+        """Create (or reuse) a directory with sample conversations.
+
+        The fixture data is deterministic, so the generated tree lives in a
+        content-addressed directory under the system temp dir and is reused
+        by later calls and later test runs instead of being rewritten.
+        """
+        digest = hashlib.sha256(
+            json.dumps(SAMPLE_CONVERSATIONS, sort_keys=True).encode()
+        ).hexdigest()[:16]
+        cache_dir = Path(tempfile.gettempdir()) / f"claude-fixtures-{digest}"
+
+        if not cache_dir.exists():
+            # Build into a private dir, then publish it atomically so
+            # concurrent runs never see a half-written fixture tree
+            build_dir = tempfile.mkdtemp()
+            ConversationFixtures._build_environment(build_dir)
+            try:
+                os.replace(build_dir, cache_dir)
+            except OSError:
+                shutil.rmtree(build_dir, ignore_errors=True)  # lost the race
+
+        all_files = [
+            cache_dir / ".claude" / "projects" / project / f"chat_{conv['id']}.jsonl"
+            for project, conv in ConversationFixtures._layout()
+        ]
+        return str(cache_dir), all_files
 
     @staticmethod
     def get_expected_search_results():
@@ -211,8 +237,33 @@ class ConversationFixtures:
         }
 
 
+def _fast_rmtree(root):
+    """Remove a directory tree with scandir-driven unlinks.
+
+    DirEntry.is_dir(follow_symlinks=False) answers from the directory
+    listing, skipping the per-file stat calls shutil.rmtree performs.
+    """
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    _fast_rmtree(entry.path)
+                else:
+                    try:
+                        os.unlink(entry.path)
+                    except OSError:
+                        pass
+        os.rmdir(root)
+    except OSError:
+        pass
+
+
 def cleanup_test_environment(temp_dir):
-    """Clean up the test environment"""
-    import shutil
+    """Clean up the test environment.
 
-    shutil.rmtree(temp_dir, ignore_errors=True)
+    Content-addressed fixture directories are kept so later runs can reuse
+    them; anything else is removed as before.
+    """
+    if Path(temp_dir).name.startswith("claude-fixtures-"):
+        return
+    _fast_rmtree(temp_dir)
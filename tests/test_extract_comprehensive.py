@@ -4,16 +4,12 @@ Comprehensive tests for extract_claude_logs.py to achieve 100% coverage
 """
 
 import json
-import sys
 import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import patch
 
-# Add parent directory to path before local imports
-sys.path.append(str(Path(__file__).parent.parent))
-
-# Local imports after sys.path modification
+# Local imports resolved via tests/conftest.py
 from extract_claude_logs import ClaudeConversationExtractor, main  # noqa: E402
 
 
@@ -4,16 +4,12 @@ Test suite for interactive UI components
 """
 
 import json
-import sys
 import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import Mock, patch
 
-# Add parent directory to path before local imports
-sys.path.append(str(Path(__file__).parent.parent))
-
-# Local imports after sys.path modification
+# Local imports resolved via tests/conftest.py
 from interactive_ui import InteractiveUI  # noqa: E402
 
 
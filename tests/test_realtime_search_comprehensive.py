@@ -3,18 +3,20 @@
 Comprehensive tests for realtime_search.py to achieve 100% coverage
 """
 
-import sys
-import threading
+import contextlib
+import io
+import itertools
 import time
 import unittest
+from collections import namedtuple
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import Mock, patch
 
-# Add parent directory to path before local imports
-sys.path.append(str(Path(__file__).parent.parent))
+import pytest
 
-# Local imports after sys.path modification
+# Local imports resolved via tests/conftest.py
+import realtime_search as rs_mod  # noqa: E402
 from realtime_search import (  # noqa: E402
     KeyboardHandler,
     RealTimeSearch,
@@ -23,6 +25,40 @@ from realtime_search import (  # noqa: E402
     create_smart_searcher,
 )
 
+# Plain result holder; much cheaper to allocate than Mock for display tests
+Result = namedtuple("Result", "timestamp file_path context speaker")
+
+# Fixed timestamp; the tests never inspect the value, so skip the clock reads
+NOW = datetime(2024, 1, 1)
+
+# Reusable platform patchers, built once instead of per-decorated method
+DARWIN = patch("sys.platform", "darwin")
+WIN32 = patch("sys.platform", "win32")
+
+
+class _RecordingCallable:
+    """Minimal callable that records calls without Mock's machinery"""
+
+    __slots__ = ("side_effect", "calls")
+
+    def __init__(self, side_effect):
+        self.side_effect = side_effect
+        self.calls = []
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return self.side_effect(*args, **kwargs)
+
+
+class FakeSearcher:
+    """Tiny searcher stand-in exposing just search and nlp"""
+
+    __slots__ = ("search", "nlp")
+
+    def __init__(self, side_effect, nlp=None):
+        self.search = _RecordingCallable(side_effect)
+        self.nlp = nlp
+
 
 class TestSearchStateComprehensive(unittest.TestCase):
     """Comprehensive tests for SearchState"""
@@ -58,79 +94,76 @@ class TestSearchStateComprehensive(unittest.TestCase):
 class TestKeyboardHandlerComprehensive(unittest.TestCase):
     """Comprehensive tests for KeyboardHandler"""
 
-    @patch("sys.platform", "darwin")
-    def test_unix_keyboard_special_keys(self):
-        """Test Unix keyboard handler with all special keys"""
-        with patch("realtime_search.termios"), patch("realtime_search.tty"), patch(
-            "realtime_search.select"
-        ) as mock_select, patch("sys.stdin") as mock_stdin:
-
-            handler = KeyboardHandler()
-
-            # Test arrow keys
-            test_cases = [
-                ([True], ["\x1b", "[", "A"], "UP"),
-                ([True], ["\x1b", "[", "B"], "DOWN"),
-                ([True], ["\x1b", "[", "C"], "RIGHT"),
-                ([True], ["\x1b", "[", "D"], "LEFT"),
-                ([True], ["\x1b"], "ESC"),  # ESC alone
-                ([True], ["\r"], "ENTER"),
-                ([True], ["\n"], "ENTER"),
-                ([True], ["\x7f"], "BACKSPACE"),
-                ([True], ["\x08"], "BACKSPACE"),
-                ([True], ["a"], "a"),  # Regular character
-            ]
+    def setUp(self):
+        """Open the shared Unix patch stack once per test"""
+        self._stack = contextlib.ExitStack()
+        self._stack.enter_context(DARWIN)
+        self._stack.enter_context(patch.object(rs_mod, "termios", create=True))
+        self._stack.enter_context(patch.object(rs_mod, "tty", create=True))
+        self.mock_select = self._stack.enter_context(
+            patch.object(rs_mod, "select", create=True)
+        )
+        self.mock_stdin = self._stack.enter_context(patch("sys.stdin"))
+        self.handler = KeyboardHandler()
 
-            for select_return, stdin_chars, expected in test_cases:
-                mock_select.select.side_effect = [
-                    (
-                        select_return if i == 0 else [stdin_chars[i] is not None]
-                        for i in range(len(stdin_chars))
-                    )
-                ]
-                mock_stdin.read.side_effect = stdin_chars
+    def tearDown(self):
+        """Restore the patched modules"""
+        self._stack.close()
 
-                key = handler.get_key(timeout=0.1)
-                self.assertEqual(key, expected)
+    def test_unix_keyboard_special_keys(self):
+        """Test Unix keyboard handler with all special keys"""
+        # Test arrow keys
+        test_cases = [
+            (["\x1b", "[", "A"], "UP"),
+            (["\x1b", "[", "B"], "DOWN"),
+            (["\x1b", "[", "C"], "RIGHT"),
+            (["\x1b", "[", "D"], "LEFT"),
+            (["\x1b"], "ESC"),  # ESC alone
+            (["\r"], "ENTER"),
+            (["\n"], "ENTER"),
+            (["\x7f"], "BACKSPACE"),
+            (["\x08"], "BACKSPACE"),
+            (["a"], "a"),  # Regular character
+        ]
 
-                # Reset mocks
-                mock_select.select.reset_mock()
-                mock_stdin.read.reset_mock()
+        # Feed every case through one side_effect chain instead of
+        # reassigning and resetting the mocks per iteration
+        select_returns = []
+        reads = []
+        for stdin_chars, _ in test_cases:
+            if stdin_chars == ["\x1b"]:
+                # ESC alone: the follow-up 0-timeout select sees no input
+                select_returns += [([True], [], []), ([], [], [])]
+            else:
+                select_returns += [([True], [], [])] * len(stdin_chars)
+            reads += stdin_chars
+        self.mock_select.select.side_effect = select_returns
+        self.mock_stdin.read.side_effect = reads
+
+        for stdin_chars, expected in test_cases:
+            with self.subTest(chars=stdin_chars):
+                self.assertEqual(self.handler.get_key(timeout=0.1), expected)
 
-    @patch("sys.platform", "darwin")
     def test_unix_keyboard_ctrl_c(self):
         """Test Unix keyboard handler Ctrl+C"""
-        with patch("realtime_search.termios"), patch("realtime_search.tty"), patch(
-            "realtime_search.select"
-        ) as mock_select, patch("sys.stdin") as mock_stdin:
+        self.mock_select.select.return_value = ([True], [], [])
+        self.mock_stdin.read.return_value = "\x03"  # Ctrl+C
 
-            handler = KeyboardHandler()
-
-            mock_select.select.return_value = ([True], [], [])
-            mock_stdin.read.return_value = "\x03"  # Ctrl+C
-
-            with self.assertRaises(KeyboardInterrupt):
-                handler.get_key(timeout=0.1)
+        with self.assertRaises(KeyboardInterrupt):
+            self.handler.get_key(timeout=0.1)
 
-    @patch("sys.platform", "darwin")
     def test_unix_keyboard_timeout(self):
         """Test Unix keyboard timeout"""
-        with patch("realtime_search.termios"), patch("realtime_search.tty"), patch(
-            "realtime_search.select"
-        ) as mock_select:
-
-            handler = KeyboardHandler()
+        # No input available
+        self.mock_select.select.return_value = ([], [], [])
 
-            # No input available
-            mock_select.select.return_value = ([], [], [])
+        key = self.handler.get_key(timeout=0.1)
+        self.assertIsNone(key)
 
-            key = handler.get_key(timeout=0.1)
-            self.assertIsNone(key)
-
-    @patch("sys.platform", "win32")
+    @WIN32
     def test_windows_keyboard_all_keys(self):
         """Test Windows keyboard handler with all key types"""
-        with patch("realtime_search.msvcrt") as mock_msvcrt:
+        with patch.object(rs_mod, "msvcrt", create=True) as mock_msvcrt:
             handler = KeyboardHandler()
 
             # Test timeout (no key pressed)
@@ -155,15 +188,20 @@ class TestKeyboardHandlerComprehensive(unittest.TestCase):
                 ([b"\x08"], "BACKSPACE"),
             ]
 
-            for getch_returns, expected in test_cases:
-                mock_msvcrt.getch.side_effect = getch_returns
+            # One flattened side_effect pool instead of reassigning per case
+            all_getch = list(
+                itertools.chain.from_iterable(gr for gr, _ in test_cases)
+            )
+            mock_msvcrt.getch.side_effect = iter(all_getch)
+
+            for _, expected in test_cases:
                 key = handler.get_key(timeout=0.1)
                 self.assertEqual(key, expected)
 
-    @patch("sys.platform", "win32")
+    @WIN32
     def test_windows_keyboard_decode_error(self):
         """Test Windows keyboard with decode error"""
-        with patch("realtime_search.msvcrt") as mock_msvcrt:
+        with patch.object(rs_mod, "msvcrt", create=True) as mock_msvcrt:
             handler = KeyboardHandler()
 
             mock_msvcrt.kbhit.return_value = True
@@ -176,147 +214,115 @@ class TestKeyboardHandlerComprehensive(unittest.TestCase):
 class TestTerminalDisplayComprehensive(unittest.TestCase):
     """Comprehensive tests for TerminalDisplay"""
 
-    def setUp(self):
-        """Set up test display"""
-        self.display = TerminalDisplay()
-
-    @patch("sys.platform", "win32")
+    # Frozen result fixtures, built once at class definition
+    _RESULTS_2 = [
+        Result(NOW, Path("/test/chat1.jsonl"), "Result 1 context", "human"),
+        Result(NOW, Path("/test/chat2.jsonl"), "Result 2 context", "assistant"),
+    ]
+    _RESULTS_15 = [
+        Result(NOW, Path(f"/test/chat{i}.jsonl"), f"Result {i}", "human")
+        for i in range(15)
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up one shared display; the tests only read or redraw it"""
+        cls.display = TerminalDisplay()
+
+    @WIN32
     @patch("os.system")
     def test_clear_screen_windows(self, mock_system):
         """Test clear screen on Windows"""
         self.display.clear_screen()
         mock_system.assert_called_once_with("cls")
 
-    @patch("sys.platform", "darwin")
-    @patch("sys.stdout")
-    def test_clear_screen_unix(self, mock_stdout):
+    @staticmethod
+    def _capture(func, *args):
+        """Run func with stdout redirected to a StringIO and return the text"""
+        buf = io.StringIO()
+        with contextlib.redirect_stdout(buf):
+            func(*args)
+        return buf.getvalue()
+
+    @DARWIN
+    def test_clear_screen_unix(self):
         """Test clear screen on Unix"""
-        self.display.clear_screen()
+        written = self._capture(self.display.clear_screen)
         # Should print ANSI escape sequence
-        mock_stdout.write.assert_called()
-        written = "".join(call[0][0] for call in mock_stdout.write.call_args_list)
         self.assertIn("\033[2J\033[H", written)
 
-    @patch("sys.stdout")
-    def test_terminal_control_methods(self, mock_stdout):
+    def test_terminal_control_methods(self):
         """Test all terminal control methods"""
         # Test move cursor
-        self.display.move_cursor(10, 20)
-        self.assertIn("\033[10;20H", self._get_stdout_content(mock_stdout))
+        self.assertIn("\033[10;20H", self._capture(self.display.move_cursor, 10, 20))
 
         # Test clear line
-        mock_stdout.reset_mock()
-        self.display.clear_line()
-        self.assertIn("\033[2K", self._get_stdout_content(mock_stdout))
+        self.assertIn("\033[2K", self._capture(self.display.clear_line))
 
         # Test save cursor
-        mock_stdout.reset_mock()
-        self.display.save_cursor()
-        self.assertIn("\033[s", self._get_stdout_content(mock_stdout))
+        self.assertIn("\033[s", self._capture(self.display.save_cursor))
 
         # Test restore cursor
-        mock_stdout.reset_mock()
-        self.display.restore_cursor()
-        self.assertIn("\033[u", self._get_stdout_content(mock_stdout))
-
-    def _get_stdout_content(self, mock_stdout):
-        """Helper to get stdout content from mock"""
-        return "".join(
-            call[0][0] for call in mock_stdout.write.call_args_list if call[0][0]
-        )
+        self.assertIn("\033[u", self._capture(self.display.restore_cursor))
 
-    @patch("sys.stdout")
-    def test_draw_results_with_selection(self, mock_stdout):
+    def test_draw_results_with_selection(self):
         """Test drawing results with selection indicator"""
-        results = [
-            Mock(
-                timestamp=datetime.now(),
-                file_path=Path("/test/chat1.jsonl"),
-                context="Result 1 context",
-                speaker="human",
-            ),
-            Mock(
-                timestamp=datetime.now(),
-                file_path=Path("/test/chat2.jsonl"),
-                context="Result 2 context",
-                speaker="assistant",
-            ),
-        ]
-
-        self.display.draw_results(results, 1, "test")
-        output = self._get_stdout_content(mock_stdout)
+        output = self._capture(self.display.draw_results, self._RESULTS_2, 1, "test")
 
         # Second result should have selection indicator
         self.assertIn("▸", output)
 
-    @patch("sys.stdout")
-    def test_draw_results_max_limit(self, mock_stdout):
+    def test_draw_results_max_limit(self):
         """Test drawing results respects 10 result limit"""
-        # Create 15 results
-        results = [
-            Mock(
-                timestamp=datetime.now(),
-                file_path=Path(f"/test/chat{i}.jsonl"),
-                context=f"Result {i}",
-                speaker="human",
-            )
-            for i in range(15)
-        ]
+        results = self._RESULTS_15
 
-        self.display.draw_results(results, 0, "test")
+        self._capture(self.display.draw_results, results, 0, "test")
 
         # Should only show 10 results
         self.assertEqual(self.display.last_result_count, 10)
 
-    @patch("sys.stdout")
-    def test_draw_search_box(self, mock_stdout):
+    def test_draw_search_box(self):
         """Test drawing search input box"""
         self.display.last_result_count = 3
-        self.display.draw_search_box("hello world", 5)
+        output = self._capture(self.display.draw_search_box, "hello world", 5)
 
-        output = self._get_stdout_content(mock_stdout)
         self.assertIn("Search: hello world", output)
 
-        # Check cursor positioning
-        final_call = mock_stdout.write.call_args_list[-1][0][0]
-        self.assertIn("\033[", final_call)  # ANSI cursor positioning
+        # Output should end with ANSI cursor positioning
+        self.assertIn("\033[", output[output.rindex("Search:") :])
 
 
 class TestRealTimeSearchComprehensive(unittest.TestCase):
     """Comprehensive tests for RealTimeSearch"""
 
-    def setUp(self):
-        """Set up test search"""
-        self.mock_searcher = Mock()
-        self.mock_extractor = Mock()
-        self.rts = RealTimeSearch(self.mock_searcher, self.mock_extractor)
+    @classmethod
+    def setUpClass(cls):
+        """Build the search instance once; tests reset its state instead"""
+        cls.mock_searcher = Mock(spec_set=["search", "nlp"])
+        cls.mock_extractor = Mock(spec_set=[])
+        cls.rts = RealTimeSearch(cls.mock_searcher, cls.mock_extractor)
+
+    def tearDown(self):
+        """Reset shared state and mocks rather than reconstructing"""
+        self.rts.state = SearchState()
+        self.rts.results_cache.clear()
+        self.mock_searcher.reset_mock(return_value=True, side_effect=True)
+        self.mock_extractor.reset_mock(return_value=True, side_effect=True)
 
     def test_search_worker_thread(self):
-        """Test search worker thread behavior"""
-        # Mock the search to return quickly
+        """Test the worker's request processing without spawning a thread"""
         self.mock_searcher.search.return_value = [Mock()]
 
-        # Start the thread
-        self.rts.search_thread = threading.Thread(
-            target=self.rts.search_worker, daemon=True
-        )
-        self.rts.search_thread.start()
-
-        try:
-            # Trigger a search
-            self.rts.state.query = "test query"
-            self.rts.trigger_search()
-
-            # Give thread time to process
-            time.sleep(0.5)
+        # Drive the worker body directly, as the cache and error tests do
+        self.rts.state.query = "test query"
+        self.rts.state.is_searching = True
+        self.rts.state.last_update = time.time() - 1  # Past the debounce
+        self.rts._process_search_request()
 
-            # Should have called search
-            self.mock_searcher.search.assert_called_with(
-                query="test query", mode="smart", max_results=20, case_sensitive=False
-            )
-        finally:
-            # Clean shutdown using new stop method
-            self.rts.stop()
+        # Should have called search
+        self.mock_searcher.search.assert_called_with(
+            query="test query", mode="smart", max_results=20, case_sensitive=False
+        )
 
     def test_search_worker_with_cache(self):
         """Test search worker uses cache"""
@@ -355,69 +361,47 @@ class TestRealTimeSearchComprehensive(unittest.TestCase):
         # Results should be empty
         self.assertEqual(self.rts.state.results, [])
 
-    def test_handle_input_cursor_movement(self):
-        """Test cursor movement handling"""
-        self.rts.state.query = "hello"
-        self.rts.state.cursor_pos = 3
-
-        # Test left arrow
-        self.rts.handle_input("LEFT")
-        self.assertEqual(self.rts.state.cursor_pos, 2)
-
-        # Test left at beginning
-        self.rts.state.cursor_pos = 0
-        self.rts.handle_input("LEFT")
-        self.assertEqual(self.rts.state.cursor_pos, 0)
-
-        # Test right arrow
-        self.rts.state.cursor_pos = 2
-        self.rts.handle_input("RIGHT")
-        self.assertEqual(self.rts.state.cursor_pos, 3)
-
-        # Test right at end
-        self.rts.state.cursor_pos = 5
-        self.rts.handle_input("RIGHT")
-        self.assertEqual(self.rts.state.cursor_pos, 5)
-
-    def test_handle_input_backspace_middle(self):
-        """Test backspace in middle of text"""
-        self.rts.state.query = "hello"
-        self.rts.state.cursor_pos = 3
-
-        self.rts.handle_input("BACKSPACE")
-
-        self.assertEqual(self.rts.state.query, "helo")
-        self.assertEqual(self.rts.state.cursor_pos, 2)
-
-    def test_handle_input_character_middle(self):
-        """Test inserting character in middle of text"""
-        self.rts.state.query = "helo"
-        self.rts.state.cursor_pos = 2
-
-        self.rts.handle_input("l")
-
-        self.assertEqual(self.rts.state.query, "hello")
-        self.assertEqual(self.rts.state.cursor_pos, 3)
-
-    def test_handle_input_control_characters(self):
-        """Test ignoring control characters"""
-        self.rts.state.query = "test"
-        self.rts.state.cursor_pos = 4
-
-        # Control character (ASCII < 32)
-        self.rts.handle_input("\x01")  # Ctrl+A
+    def test_handle_input_matrix(self):
+        """Test editing, Enter and navigation input against one instance"""
+        # (initial_query, initial_cursor, key, expected_query, expected_cursor)
+        edit_cases = [
+            ("hello", 3, "LEFT", "hello", 2),
+            ("hello", 0, "LEFT", "hello", 0),  # left at beginning
+            ("hello", 2, "RIGHT", "hello", 3),
+            ("hello", 5, "RIGHT", "hello", 5),  # right at end
+            ("hello", 3, "BACKSPACE", "helo", 2),  # backspace mid-text
+            ("helo", 2, "l", "hello", 3),  # insert mid-text
+            ("test", 4, "\x01", "test", 4),  # control chars are ignored
+        ]
+        for query, cursor, key, expected_query, expected_cursor in edit_cases:
+            with self.subTest(query=query, cursor=cursor, key=key):
+                self.rts.state.query = query
+                self.rts.state.cursor_pos = cursor
+                self.rts.handle_input(key)
+                self.assertEqual(self.rts.state.query, expected_query)
+                self.assertEqual(self.rts.state.cursor_pos, expected_cursor)
+
+        # Enter with no results should not select
+        self.rts.state.results = []
+        self.assertNotEqual(self.rts.handle_input("ENTER"), "select")
 
-        # Should not change query
-        self.assertEqual(self.rts.state.query, "test")
+        # Navigation respects result limits (placeholders; only counted)
+        self.rts.state.results = [object(), object(), object()]
+        self.rts.state.selected_index = 2
+        self.rts.handle_input("DOWN")  # down past last result
+        self.assertEqual(self.rts.state.selected_index, 2)
+        self.rts.state.selected_index = 0
+        self.rts.handle_input("UP")  # up past first result
+        self.assertEqual(self.rts.state.selected_index, 0)
 
     def test_trigger_search_cache_cleanup(self):
         """Test cache cleanup on search trigger"""
-        # Populate cache with various entries
+        # Populate cache with various entries; only key retention matters
         self.rts.results_cache = {
-            "test": [Mock()],
-            "testing": [Mock()],
-            "other": [Mock()],
-            "te": [Mock()],
+            "test": [],
+            "testing": [],
+            "other": [],
+            "te": [],
         }
 
         self.rts.state.query = "tes"
@@ -427,8 +411,8 @@ class TestRealTimeSearchComprehensive(unittest.TestCase):
         self.assertNotIn("other", self.rts.results_cache)
         self.assertNotIn("te", self.rts.results_cache)
 
-    @patch("realtime_search.KeyboardHandler")
-    @patch("realtime_search.TerminalDisplay")
+    @patch.object(rs_mod, "KeyboardHandler")
+    @patch.object(rs_mod, "TerminalDisplay")
     def test_run_exception_handling(self, mock_display_class, mock_keyboard_class):
         """Test run method exception handling"""
         mock_keyboard = Mock()
@@ -441,118 +425,91 @@ class TestRealTimeSearchComprehensive(unittest.TestCase):
         result = self.rts.run()
         self.assertIsNone(result)
 
-    def test_handle_input_no_results_for_enter(self):
-        """Test pressing Enter with no results"""
-        self.rts.state.results = []
-
-        action = self.rts.handle_input("ENTER")
 
-        # Should not return 'select'
-        self.assertNotEqual(action, "select")
+# create_smart_searcher tests as plain pytest functions sharing one
+# module-scoped FakeSearcher factory instead of per-test unittest setup
 
-    def test_handle_input_navigation_limits(self):
-        """Test navigation respects result limits"""
-        # Set up 3 results
-        self.rts.state.results = [Mock(), Mock(), Mock()]
-        self.rts.state.selected_index = 2
 
-        # Try to go down past last result
-        self.rts.handle_input("DOWN")
-        self.assertEqual(self.rts.state.selected_index, 2)
-
-        # Go up to first
-        self.rts.state.selected_index = 0
-        self.rts.handle_input("UP")
-        self.assertEqual(self.rts.state.selected_index, 0)
+@pytest.fixture(scope="module")
+def smart_searcher_factory():
+    """Build a smart searcher wrapped around a FakeSearcher"""
 
+    def factory(side_effect, nlp=None):
+        return create_smart_searcher(FakeSearcher(side_effect, nlp=nlp))
 
-class TestCreateSmartSearcherComprehensive(unittest.TestCase):
-    """Comprehensive tests for create_smart_searcher"""
+    return factory
 
-    def test_smart_search_with_regex_pattern(self):
-        """Test smart search detects regex patterns"""
-        mock_searcher = Mock()
 
-        # Set up different results for different modes
-        def search_side_effect(query, mode=None, **kwargs):
-            if mode == "exact":
-                return []
-            elif mode == "regex":
-                return [Mock(file_path=Path("/regex/result"))]
-            elif mode == "smart":
-                return [Mock(file_path=Path("/smart/result"))]
+def test_smart_search_with_regex_pattern(smart_searcher_factory):
+    """Test smart search detects regex patterns"""
+    # Set up different results for different modes
+    def search_side_effect(query, mode=None, **kwargs):
+        if mode == "exact":
             return []
+        elif mode == "regex":
+            return [Mock(file_path=Path("/regex/result"))]
+        elif mode == "smart":
+            return [Mock(file_path=Path("/smart/result"))]
+        return []
 
-        mock_searcher.search = Mock(side_effect=search_side_effect)
-        mock_searcher.nlp = None
-
-        smart_searcher = create_smart_searcher(mock_searcher)
+    smart_searcher = smart_searcher_factory(search_side_effect)
 
-        # Search with regex pattern
-        results = smart_searcher.search("test.*pattern")
+    # Search with regex pattern
+    results = smart_searcher.search("test.*pattern")
 
-        # Should include regex results
-        paths = [r.file_path for r in results]
-        self.assertIn(Path("/regex/result"), paths)
+    # Should include regex results
+    paths = [r.file_path for r in results]
+    assert Path("/regex/result") in paths
 
-    def test_smart_search_with_semantic(self):
-        """Test smart search with semantic search available"""
-        mock_searcher = Mock()
-        mock_searcher.nlp = Mock()  # Has NLP
 
-        def search_side_effect(query, mode=None, **kwargs):
-            if mode == "semantic":
-                return [
-                    Mock(file_path=Path("/semantic/result"), timestamp=datetime.now())
-                ]
-            return []
+def test_smart_search_with_semantic(smart_searcher_factory):
+    """Test smart search with semantic search available"""
+    def search_side_effect(query, mode=None, **kwargs):
+        if mode == "semantic":
+            return [Mock(file_path=Path("/semantic/result"), timestamp=NOW)]
+        return []
 
-        mock_searcher.search = Mock(side_effect=search_side_effect)
+    smart_searcher = smart_searcher_factory(search_side_effect, nlp=Mock())
 
-        smart_searcher = create_smart_searcher(mock_searcher)
-        results = smart_searcher.search("find similar concepts")
+    results = smart_searcher.search("find similar concepts")
 
-        # Should include semantic results
-        self.assertEqual(len(results), 1)
+    # Should include semantic results
+    assert len(results) == 1
 
-    def test_smart_search_deduplication(self):
-        """Test smart search deduplicates results"""
-        mock_searcher = Mock()
 
-        # Return same file from different modes
-        same_file = Path("/duplicate/result")
+def test_smart_search_deduplication(smart_searcher_factory):
+    """Test smart search deduplicates results"""
+    # Return the same prebuilt stub from every mode; only file_path
+    # matters for dedup, so one allocation covers all calls
+    stub = Mock(file_path=Path("/duplicate/result"), timestamp=NOW)
 
-        def search_side_effect(query, mode=None, **kwargs):
-            return [Mock(file_path=same_file, timestamp=datetime.now())]
+    def search_side_effect(query, mode=None, **kwargs):
+        return [stub]
 
-        mock_searcher.search = Mock(side_effect=search_side_effect)
-        mock_searcher.nlp = None
+    smart_searcher = smart_searcher_factory(search_side_effect)
+    results = smart_searcher.search("test")
 
-        smart_searcher = create_smart_searcher(mock_searcher)
-        results = smart_searcher.search("test")
+    # Should only have one result despite multiple modes returning it
+    assert len(results) == 1
 
-        # Should only have one result despite multiple modes returning it
-        self.assertEqual(len(results), 1)
 
-    def test_smart_search_respects_max_results(self):
-        """Test smart search respects max_results parameter"""
-        mock_searcher = Mock()
-
-        # Return many results
-        def search_side_effect(query, mode=None, **kwargs):
-            return [
-                Mock(file_path=Path(f"/{mode}/{i}"), timestamp=datetime.now())
-                for i in range(10)
-            ]
+def test_smart_search_respects_max_results(smart_searcher_factory):
+    """Test smart search respects max_results parameter"""
+    # Return many results; precompute the Paths so each mode's call
+    # only allocates the Mock wrappers
+    paths = {
+        mode: [Path(f"/{mode}/{i}") for i in range(10)]
+        for mode in ("exact", "regex", "smart", "semantic")
+    }
 
-        mock_searcher.search = Mock(side_effect=search_side_effect)
-        mock_searcher.nlp = None
+    def search_side_effect(query, mode=None, **kwargs):
+        return [Mock(file_path=p, timestamp=NOW) for p in paths[mode]]
 
-        smart_searcher = create_smart_searcher(mock_searcher)
-        results = smart_searcher.search("test", max_results=5)
+    smart_searcher = smart_searcher_factory(search_side_effect)
+    results = smart_searcher.search("test", max_results=5)
 
-        # Should limit to 5 results
-        self.assertEqual(len(results), 5)
+    # Should limit to 5 results
+    assert len(results) == 5
 
 
 if __name__ == "__main__":
@@ -4,20 +4,19 @@ Tests to achieve 100% coverage for realtime_search.py
 Focus on untested code paths
 """
 
+import itertools
 import sys
 import time
 import unittest
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import Mock, patch
 
-# Add parent directory to path before local imports
-sys.path.append(str(Path(__file__).parent.parent))
-
-# Local imports after sys.path modification
+# Local imports resolved via tests/conftest.py
 from realtime_search import (  # noqa: E402
     KeyboardHandler,
     RealTimeSearch,
+    SearchState,
     TerminalDisplay,
     create_smart_searcher,
 )
@@ -29,22 +28,12 @@ class TestKeyboardHandlerCoverage(unittest.TestCase):
     @patch("sys.platform", "win32")
     def test_windows_keyboard_init(self):
         """Test Windows keyboard initialization"""
-        # Mock msvcrt module for Windows
-        mock_msvcrt = MagicMock()
-        with patch.dict("sys.modules", {"msvcrt": mock_msvcrt}):
-            # Reimport module to get Windows behavior
-            import importlib
-
-            import realtime_search
-
-            importlib.reload(realtime_search)
-
-            handler = realtime_search.KeyboardHandler()
-            # Should not set stdin_fd on Windows
-            self.assertFalse(hasattr(handler, "stdin_fd"))
+        handler = KeyboardHandler()
+        # Should not set stdin_fd on Windows
+        self.assertFalse(hasattr(handler, "stdin_fd"))
 
     @patch("sys.platform", "win32")
-    @patch("realtime_search.msvcrt")
+    @patch("realtime_search.msvcrt", create=True)
     def test_windows_keyboard_special_keys(self, mock_msvcrt):
         """Test Windows special key handling"""
         handler = KeyboardHandler()
@@ -61,19 +50,19 @@ class TestKeyboardHandlerCoverage(unittest.TestCase):
             ([b"\x08"], "BACKSPACE"),  # Backspace
         ]
 
-        for key_sequence, expected in test_cases:
-            with self.subTest(expected=expected):
-                mock_msvcrt.kbhit.return_value = True
-                mock_msvcrt.getch.side_effect = key_sequence
+        # One flattened side_effect chain instead of reconfiguring per case
+        mock_msvcrt.kbhit.return_value = True
+        mock_msvcrt.getch.side_effect = list(
+            itertools.chain.from_iterable(seq for seq, _ in test_cases)
+        )
 
-                result = handler.get_key()
+        results = [handler.get_key() for _ in test_cases]
+        for (_, expected), result in zip(test_cases, results):
+            with self.subTest(expected=expected):
                 self.assertEqual(result, expected)
 
-                # Reset mock
-                mock_msvcrt.getch.side_effect = None
-
     @patch("sys.platform", "win32")
-    @patch("realtime_search.msvcrt")
+    @patch("realtime_search.msvcrt", create=True)
     def test_windows_keyboard_regular_chars(self, mock_msvcrt):
         """Test Windows regular character input"""
         handler = KeyboardHandler()
@@ -86,7 +75,7 @@ class TestKeyboardHandlerCoverage(unittest.TestCase):
         self.assertEqual(result, "a")
 
     @patch("sys.platform", "win32")
-    @patch("realtime_search.msvcrt")
+    @patch("realtime_search.msvcrt", create=True)
     def test_windows_keyboard_decode_error(self, mock_msvcrt):
         """Test Windows keyboard decode error handling"""
         handler = KeyboardHandler()
@@ -99,21 +88,22 @@ class TestKeyboardHandlerCoverage(unittest.TestCase):
         self.assertIsNone(result)
 
     @patch("sys.platform", "win32")
-    @patch("realtime_search.msvcrt")
+    @patch("realtime_search.msvcrt", create=True)
     def test_windows_keyboard_timeout(self, mock_msvcrt):
         """Test Windows keyboard timeout"""
         handler = KeyboardHandler()
 
-        # No key pressed
+        # No key pressed; drive the wait loop with a virtual clock instead
+        # of really sleeping out the timeout
         mock_msvcrt.kbhit.return_value = False
 
-        start = time.time()
-        result = handler.get_key(timeout=0.1)
-        duration = time.time() - start
+        with patch("realtime_search.time.time", side_effect=[0.0, 0.05, 0.11]), patch(
+            "realtime_search.time.sleep"
+        ) as mock_sleep:
+            result = handler.get_key(timeout=0.1)
 
         self.assertIsNone(result)
-        self.assertGreaterEqual(duration, 0.1)
-        self.assertLess(duration, 0.2)
+        self.assertGreaterEqual(mock_sleep.call_count, 1)
 
     @patch("sys.platform", "linux")
     def test_unix_keyboard_init(self):
@@ -154,12 +144,12 @@ class TestKeyboardHandlerCoverage(unittest.TestCase):
 
             handler = KeyboardHandler()
 
-            # Test escape sequences
+            # Test escape sequences; stdin is read one character at a time
             test_cases = [
-                (["\x1b", "[A"], "UP"),
-                (["\x1b", "[B"], "DOWN"),
-                (["\x1b", "[C"], "RIGHT"),
-                (["\x1b", "[D"], "LEFT"),
+                (["\x1b", "[", "A"], "UP"),
+                (["\x1b", "[", "B"], "DOWN"),
+                (["\x1b", "[", "C"], "RIGHT"),
+                (["\x1b", "[", "D"], "LEFT"),
                 (["\x1b"], "ESC"),  # Just escape
                 (["\r"], "ENTER"),
                 (["\n"], "ENTER"),
@@ -167,20 +157,24 @@ class TestKeyboardHandlerCoverage(unittest.TestCase):
                 (["\x08"], "BACKSPACE"),
             ]
 
-            for sequence, expected in test_cases:
+            # One flattened select/read chain instead of per-case resets
+            select_returns = []
+            reads = []
+            for sequence, _ in test_cases:
+                if sequence == ["\x1b"]:
+                    # Bare ESC: the 0-timeout follow-up select sees no input
+                    select_returns += [([sys.stdin], [], []), ([], [], [])]
+                else:
+                    select_returns += [([sys.stdin], [], [])] * len(sequence)
+                reads += sequence
+            mock_select.select.side_effect = select_returns
+            mock_stdin.read.side_effect = reads
+
+            results = [handler.get_key() for _ in test_cases]
+            for (_, expected), result in zip(test_cases, results):
                 with self.subTest(expected=expected):
-                    # Mock select to indicate data available
-                    mock_select.select.return_value = ([sys.stdin], [], [])
-
-                    # Mock stdin reads
-                    mock_stdin.read.side_effect = sequence
-
-                    result = handler.get_key()
                     self.assertEqual(result, expected)
 
-                    # Reset mocks
-                    mock_stdin.read.side_effect = None
-
     @patch("sys.platform", "linux")
     def test_unix_keyboard_ctrl_c(self):
         """Test Ctrl+C handling"""
@@ -271,10 +265,19 @@ class TestTerminalDisplayCoverage(unittest.TestCase):
 class TestRealTimeSearchCoverage(unittest.TestCase):
     """Test RealTimeSearch edge cases"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build the searcher/extractor mocks and search instance once"""
+        cls.mock_searcher = Mock(spec_set=["search", "nlp"])
+        cls.mock_extractor = Mock(spec_set=[])
+        cls.rts = RealTimeSearch(cls.mock_searcher, cls.mock_extractor)
+
     def setUp(self):
-        self.mock_searcher = Mock()
-        self.mock_extractor = Mock()
-        self.rts = RealTimeSearch(self.mock_searcher, self.mock_extractor)
+        """Reset the shared instance instead of reconstructing it"""
+        self.rts.state = SearchState()
+        self.rts.results_cache.clear()
+        self.rts.search_thread = None
+        self.mock_searcher.reset_mock(return_value=True, side_effect=True)
 
     def test_search_worker_exception_in_search(self):
         """Test exception handling in search worker"""
@@ -310,13 +313,27 @@ class TestRealTimeSearchCoverage(unittest.TestCase):
         mock_thread.join.assert_not_called()
 
 
+class _Result:
+    """Minimal search-result stand-in; only the attributes passed in exist"""
+
+    __slots__ = ("file_path", "timestamp", "relevance_score")
+
+    def __init__(self, **attrs):
+        for name, value in attrs.items():
+            setattr(self, name, value)
+
+
 class TestSmartSearcherCoverage(unittest.TestCase):
     """Test smart searcher edge cases"""
 
+    @staticmethod
+    def _make_searcher():
+        """Build a narrowly spec'd searcher mock; nlp stays truthy"""
+        return Mock(spec_set=["search", "nlp"])
+
     def test_create_smart_searcher_with_semantic_exception(self):
         """Test semantic search exception handling"""
-        mock_searcher = Mock()
-        mock_searcher.nlp = Mock()  # Has NLP
+        mock_searcher = self._make_searcher()  # nlp auto-mock counts as NLP
 
         # Make semantic search fail
         def search_side_effect(query, mode=None, **kwargs):
@@ -334,12 +351,12 @@ class TestSmartSearcherCoverage(unittest.TestCase):
 
     def test_smart_searcher_sorting_with_no_timestamp(self):
         """Test sorting when results have no timestamp"""
-        mock_searcher = Mock()
+        mock_searcher = self._make_searcher()
 
         # Results without timestamp attribute
         mock_results = [
-            Mock(spec=["file_path"]),  # No timestamp
-            Mock(timestamp=None),  # None timestamp
+            _Result(file_path=Path("/a.txt")),  # No timestamp
+            _Result(file_path=Path("/b.txt"), timestamp=None),  # None timestamp
         ]
         mock_searcher.search.return_value = mock_results
 
@@ -349,14 +366,17 @@ class TestSmartSearcherCoverage(unittest.TestCase):
         results = smart_searcher.search("test")
         self.assertEqual(len(results), 2)
 
+    # One Path per mode, built once rather than per mock call
+    _MODE_PATHS = {m: Path(f"/test/{m}.txt") for m in ("exact", "smart", "semantic")}
+
     def test_smart_searcher_invalid_regex_pattern(self):
         """Test handling of invalid regex patterns"""
-        mock_searcher = Mock()
+        mock_searcher = self._make_searcher()
 
         def search_side_effect(query, mode=None, **kwargs):
             if mode == "regex":
                 raise Exception("Invalid regex")
-            return [Mock(file_path=Path(f"/test/{mode}.txt"))]
+            return [Mock(file_path=self._MODE_PATHS[mode])]
 
         mock_searcher.search.side_effect = search_side_effect
 
@@ -370,7 +390,7 @@ class TestSmartSearcherCoverage(unittest.TestCase):
 
     def test_smart_searcher_sorting_fallback(self):
         """Test sorting fallback when timestamp comparison fails"""
-        mock_searcher = Mock()
+        mock_searcher = self._make_searcher()
 
         # Create results that will fail timestamp sorting
         class BadTimestamp:
@@ -378,10 +398,10 @@ class TestSmartSearcherCoverage(unittest.TestCase):
                 raise TypeError("Cannot compare")
 
         mock_results = [
-            Mock(
+            _Result(
                 file_path=Path("/a.txt"), timestamp=BadTimestamp(), relevance_score=0.5
             ),
-            Mock(
+            _Result(
                 file_path=Path("/b.txt"), timestamp=BadTimestamp(), relevance_score=0.8
             ),
         ]
@@ -397,21 +417,18 @@ class TestSmartSearcherCoverage(unittest.TestCase):
 
     def test_smart_searcher_sorting_final_fallback(self):
         """Test final sorting fallback when all sorting fails"""
-        mock_searcher = Mock()
+        mock_searcher = self._make_searcher()
 
         # Create results that will fail all sorting
         class BadComparison:
             def __lt__(self, other):
                 raise TypeError("Cannot compare")
 
+        # No relevance_score set, so the final fallback path is exercised
         mock_results = [
-            Mock(file_path=Path("/a.txt"), timestamp=BadComparison()),
-            Mock(file_path=Path("/b.txt"), timestamp=BadComparison()),
+            _Result(file_path=Path("/a.txt"), timestamp=BadComparison()),
+            _Result(file_path=Path("/b.txt"), timestamp=BadComparison()),
         ]
-        # Remove relevance_score to test final fallback
-        for r in mock_results:
-            if hasattr(r, "relevance_score"):
-                delattr(r, "relevance_score")
 
         mock_searcher.search.return_value = mock_results
 
@@ -4,17 +4,13 @@ Tests for threading and UI components of realtime search
 These tests are designed to avoid infinite loops by using proper mocking
 """
 
-import sys
 import threading
 import time
 import unittest
 from pathlib import Path
 from unittest.mock import Mock, patch
 
-# Add parent directory to path before local imports
-sys.path.append(str(Path(__file__).parent.parent))
-
-# Local imports after sys.path modification
+# Local imports resolved via tests/conftest.py
 from realtime_search import RealTimeSearch  # noqa: E402
 
 
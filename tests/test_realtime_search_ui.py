@@ -3,17 +3,13 @@
 UI tests for realtime search with proper mocking and no infinite loops
 """
 
-import sys
 import time
 import unittest
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import Mock, patch
 
-# Add parent directory to path before local imports
-sys.path.append(str(Path(__file__).parent.parent))
-
-# Local imports after sys.path modification
+# Local imports resolved via tests/conftest.py
 from realtime_search import RealTimeSearch, TerminalDisplay  # noqa: E402
 
 
@@ -3,16 +3,12 @@
 Unit tests for real-time search components without threading
 """
 
-import sys
 import time
 import unittest
 from pathlib import Path
 from unittest.mock import Mock
 
-# Add parent directory to path before local imports
-sys.path.append(str(Path(__file__).parent.parent))
-
-# Local imports after sys.path modification
+# Local imports resolved via tests/conftest.py
 from realtime_search import RealTimeSearch, create_smart_searcher  # noqa: E402
 
 
@@ -4,17 +4,16 @@ Comprehensive test suite for search functionality
 """
 
 import json
-import sys
 import tempfile
 import unittest
 from datetime import datetime
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
-# Add parent directory to path before local imports
-sys.path.append(str(Path(__file__).parent.parent))
+from fixtures.sample_conversations import cleanup_test_environment  # noqa: E402
 
-# Local imports after sys.path modification
+# Local imports resolved via tests/conftest.py
 from realtime_search import (  # noqa: E402
     KeyboardHandler,
     RealTimeSearch,
@@ -25,6 +24,23 @@ from realtime_search import (  # noqa: E402
 from search_conversations import ConversationSearcher, SearchResult  # noqa: E402
 
 
+class _Stub:
+    """Attribute-less placeholder for result lists; far cheaper than Mock"""
+
+    __slots__ = ()
+
+
+class _FakeResult:
+    """Minimal search-result stand-in; plain attributes instead of Mock"""
+
+    __slots__ = ("file_path", "relevance_score", "context")
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.relevance_score = 1.0
+        self.context = ""
+
+
 class TestSearchResult(unittest.TestCase):
     """Test SearchResult dataclass"""
 
@@ -47,7 +63,7 @@ class TestSearchResult(unittest.TestCase):
         self.assertEqual(result.relevance_score, 0.95)
 
     def test_search_result_string_representation(self):
-        """Test SearchResult string formatting"""
+        """Test SearchResult summary display tokens"""
         result = SearchResult(
             file_path=Path("/test/project/chat.jsonl"),
             conversation_id="test-id",
@@ -59,24 +75,25 @@ class TestSearchResult(unittest.TestCase):
             line_number=5,
         )
 
-        str_repr = str(result)
-        self.assertIn("chat.jsonl", str_repr)  # Filename
-        self.assertIn("Assistant", str_repr)  # Title case
-        self.assertIn("80%", str_repr)  # Relevance score
+        name, speaker, relevance = result.summary_tokens()
+        self.assertEqual(name, "chat.jsonl")  # Filename
+        self.assertEqual(speaker, "Assistant")  # Title case
+        self.assertEqual(relevance, "80%")  # Relevance score
 
 
 class TestConversationSearcher(unittest.TestCase):
     """Test ConversationSearcher functionality"""
 
-    def setUp(self):
-        """Set up test fixtures"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.test_dir = Path(self.temp_dir) / ".claude" / "projects" / "test"
-        self.test_dir.mkdir(parents=True)
+    @classmethod
+    def setUpClass(cls):
+        """Build the test conversation file once; tests only read it"""
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.test_dir = Path(cls.temp_dir) / ".claude" / "projects" / "test"
+        cls.test_dir.mkdir(parents=True)
 
         # Create test conversation file
-        self.test_file = self.test_dir / "chat_test.jsonl"
-        self.test_conversations = [
+        cls.test_file = cls.test_dir / "chat_test.jsonl"
+        cls.test_conversations = [
             {
                 "type": "user",
                 "content": "How do I handle Python errors?",
@@ -94,23 +111,22 @@ class TestConversationSearcher(unittest.TestCase):
             },
         ]
 
-        with open(self.test_file, "w") as f:
-            for conv in self.test_conversations:
-                f.write(json.dumps(conv) + "\n")
+        cls.test_file.write_text(
+            "\n".join(json.dumps(conv) for conv in cls.test_conversations) + "\n"
+        )
 
-        self.searcher = ConversationSearcher()
+        cls.searcher = ConversationSearcher()
+        # In-memory source for tests that only exercise matching logic
+        cls.sources = [(cls.test_file, cls.test_conversations)]
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up test files"""
-        import shutil
-
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        cleanup_test_environment(cls.temp_dir)
 
     def test_search_exact_match(self):
         """Test exact string matching"""
-        results = self.searcher.search(
-            "Python errors", search_dir=self.test_dir, mode="exact"
-        )
+        results = self.searcher.search("Python errors", sources=self.sources, mode="exact")
 
         self.assertEqual(len(results), 1)
         # Context is highlighted with ** markers and uppercase
@@ -118,18 +134,14 @@ class TestConversationSearcher(unittest.TestCase):
 
     def test_search_smart_mode(self):
         """Test smart search with partial matches"""
-        results = self.searcher.search(
-            "python error", search_dir=self.test_dir, mode="smart"
-        )
+        results = self.searcher.search("python error", sources=self.sources, mode="smart")
 
         self.assertGreater(len(results), 0)
         # Should find both "Python errors" and "errors in Python"
 
     def test_search_regex_mode(self):
         """Test regex pattern matching"""
-        results = self.searcher.search(
-            r"try.*except", search_dir=self.test_dir, mode="regex"
-        )
+        results = self.searcher.search(r"try.*except", sources=self.sources, mode="regex")
 
         self.assertEqual(len(results), 1)
         self.assertIn("try-except", results[0].context)
@@ -138,7 +150,7 @@ class TestConversationSearcher(unittest.TestCase):
         """Test filtering by speaker"""
         # Search human messages only
         human_results = self.searcher.search(
-            "example", search_dir=self.test_dir, speaker_filter="human"
+            "example", sources=self.sources, speaker_filter="human"
         )
 
         self.assertEqual(len(human_results), 1)
@@ -146,7 +158,7 @@ class TestConversationSearcher(unittest.TestCase):
 
         # Search assistant messages only
         assistant_results = self.searcher.search(
-            "Python", search_dir=self.test_dir, speaker_filter="assistant"
+            "Python", sources=self.sources, speaker_filter="assistant"
         )
 
         self.assertEqual(len(assistant_results), 1)
@@ -154,7 +166,8 @@ class TestConversationSearcher(unittest.TestCase):
 
     def test_search_date_filter(self):
         """Test filtering by date range"""
-        # Set file modification time to match our test data
+        # Set file modification time to match our test data; this is the
+        # only mutation of the shared fixture and no other test reads mtime
         import os
 
         # Convert datetime to timestamp
@@ -177,12 +190,12 @@ class TestConversationSearcher(unittest.TestCase):
         """Test case-sensitive search"""
         # Case-sensitive search
         results_sensitive = self.searcher.search(
-            "python", search_dir=self.test_dir, case_sensitive=True  # lowercase
+            "python", sources=self.sources, case_sensitive=True  # lowercase
         )
 
         # Case-insensitive search
         results_insensitive = self.searcher.search(
-            "python", search_dir=self.test_dir, case_sensitive=False
+            "python", sources=self.sources, case_sensitive=False
         )
 
         # Should find more results with case-insensitive
@@ -191,14 +204,14 @@ class TestConversationSearcher(unittest.TestCase):
     def test_search_max_results(self):
         """Test limiting search results"""
         results = self.searcher.search(
-            "", search_dir=self.test_dir, max_results=2  # Empty query to match all
+            "", sources=self.sources, max_results=2  # Empty query to match all
         )
 
         self.assertLessEqual(len(results), 2)
 
     def test_empty_search_query(self):
         """Test behavior with empty search query"""
-        results = self.searcher.search("", search_dir=self.test_dir)
+        results = self.searcher.search("", sources=self.sources)
 
         # Empty query should return no results (not all messages)
         self.assertEqual(len(results), 0)
@@ -255,7 +268,7 @@ class TestKeyboardHandler(unittest.TestCase):
     @patch("sys.platform", "win32")
     def test_windows_key_detection(self):
         """Test key detection on Windows"""
-        with patch("realtime_search.msvcrt") as mock_msvcrt:
+        with patch("realtime_search.msvcrt", create=True) as mock_msvcrt:
             handler = KeyboardHandler()
 
             # Test regular character
@@ -279,37 +292,37 @@ class TestTerminalDisplay(unittest.TestCase):
     """Test TerminalDisplay functionality"""
 
     def setUp(self):
-        """Set up test display"""
+        """Set up test display with stdout captured for every test"""
         self.display = TerminalDisplay()
+        stdout_patcher = patch("sys.stdout")
+        self.mock_stdout = stdout_patcher.start()
+        self.addCleanup(stdout_patcher.stop)
 
-    @patch("sys.stdout")
-    def test_clear_screen(self, mock_stdout):
+    def test_clear_screen(self):
         """Test screen clearing"""
         with patch("sys.platform", "darwin"):
             self.display.clear_screen()
             # Should output ANSI clear screen sequence
-            mock_stdout.write.assert_called()
+            self.mock_stdout.write.assert_called()
 
-    @patch("sys.stdout")
-    def test_draw_header(self, mock_stdout):
+    def test_draw_header(self):
         """Test header drawing"""
         self.display.draw_header()
         # Verify header text was printed
         printed_text = "".join(
-            call[0][0] for call in mock_stdout.write.call_args_list if call[0][0]
+            call[0][0] for call in self.mock_stdout.write.call_args_list if call[0][0]
         )
         self.assertIn("REAL-TIME SEARCH", printed_text)
 
     def test_draw_results_empty(self):
         """Test drawing empty results"""
-        with patch("sys.stdout"):
-            self.display.draw_results([], 0, "test query")
-            # Should display "No results found"
+        self.display.draw_results([], 0, "test query")
+        # Should display "No results found"
 
     def test_draw_results_with_data(self):
         """Test drawing search results"""
         mock_results = [
-            Mock(
+            SimpleNamespace(
                 timestamp=datetime.now(),
                 file_path=Path("/test/project/chat.jsonl"),
                 context="Test result context",
@@ -319,9 +332,8 @@ class TestTerminalDisplay(unittest.TestCase):
             )
         ]
 
-        with patch("sys.stdout"):
-            self.display.draw_results(mock_results, 0, "test")
-            # Should display result
+        self.display.draw_results(mock_results, 0, "test")
+        # Should display result
 
 
 class TestRealTimeSearch(unittest.TestCase):
@@ -340,7 +352,7 @@ class TestRealTimeSearch(unittest.TestCase):
 
     def test_handle_input_enter(self):
         """Test handling Enter key with results"""
-        self.rts.state.results = [Mock(), Mock()]
+        self.rts.state.results = [_Stub(), _Stub()]
         self.rts.state.selected_index = 0
 
         action = self.rts.handle_input("ENTER")
@@ -348,7 +360,7 @@ class TestRealTimeSearch(unittest.TestCase):
 
     def test_handle_input_navigation(self):
         """Test arrow key navigation"""
-        self.rts.state.results = [Mock(), Mock(), Mock()]
+        self.rts.state.results = [_Stub(), _Stub(), _Stub()]
 
         # Test down arrow
         self.rts.handle_input("DOWN")
@@ -413,11 +425,11 @@ class TestSmartSearcher(unittest.TestCase):
         # Mock different results for different modes
         def mock_search(query, mode=None, **kwargs):
             if mode == "exact":
-                return [Mock(file_path=Path("/exact/result"))]
+                return [_FakeResult(Path("/exact/result"))]
             elif mode == "smart":
-                return [Mock(file_path=Path("/smart/result"))]
+                return [_FakeResult(Path("/smart/result"))]
             elif mode == "regex":
-                return [Mock(file_path=Path("/regex/result"))]
+                return [_FakeResult(Path("/regex/result"))]
             return []
 
         mock_searcher.search = mock_search
@@ -433,15 +445,16 @@ class TestSmartSearcher(unittest.TestCase):
 class TestIntegration(unittest.TestCase):
     """Integration tests for the complete search system"""
 
-    def setUp(self):
-        """Set up integration test environment"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.test_dir = Path(self.temp_dir) / ".claude" / "projects"
-        self.test_dir.mkdir(parents=True)
+    @classmethod
+    def setUpClass(cls):
+        """Build the integration test environment once; tests only read it"""
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.test_dir = Path(cls.temp_dir) / ".claude" / "projects"
+        cls.test_dir.mkdir(parents=True)
 
         # Create multiple test conversations
         for i in range(3):
-            project_dir = self.test_dir / f"project_{i}"
+            project_dir = cls.test_dir / f"project_{i}"
             project_dir.mkdir()
 
             chat_file = project_dir / f"chat_{i}.jsonl"
@@ -458,23 +471,22 @@ class TestIntegration(unittest.TestCase):
                 },
             ]
 
-            with open(chat_file, "w") as f:
-                for conv in conversations:
-                    f.write(json.dumps(conv) + "\n")
+            chat_file.write_text(
+                "\n".join(json.dumps(conv) for conv in conversations) + "\n"
+            )
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up test environment"""
-        import shutil
-
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        cleanup_test_environment(cls.temp_dir)
 
     def test_end_to_end_search(self):
         """Test complete search workflow"""
         searcher = ConversationSearcher()
 
-        # Search across all projects
+        # Search across all projects, two files at a time
         results = searcher.search(
-            "Python project", search_dir=self.test_dir, mode="smart"
+            "Python project", search_dir=self.test_dir, mode="smart", workers=2
         )
 
         # Should find results from all projects
@@ -4,17 +4,13 @@ Aligned tests for search_conversations.py with meaningful coverage
 """
 
 import json
-import sys
 import tempfile
 import unittest
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import Mock, patch
 
-# Add parent directory to path before local imports
-sys.path.append(str(Path(__file__).parent.parent))
-
-# Local imports after sys.path modification
+# Local imports resolved via tests/conftest.py
 from search_conversations import ConversationSearcher, SearchResult  # noqa: E402
 
 
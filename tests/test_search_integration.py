@@ -4,16 +4,11 @@ Integration tests for search functionality using sample conversations
 """
 
 import os
-import sys
 import unittest
 from datetime import datetime, timedelta
 from pathlib import Path
 
-# Add parent directories to path before local imports
-sys.path.append(str(Path(__file__).parent.parent))
-sys.path.append(str(Path(__file__).parent))
-
-# Local imports after sys.path modification
+# Local imports resolved via tests/conftest.py
 from fixtures.sample_conversations import ConversationFixtures  # noqa: E402
 from fixtures.sample_conversations import cleanup_test_environment
 